@@ -330,5 +330,280 @@ schema = {
 }
 
 
-with open("pfx-schema", "w") as f:
-    json.dump(schema, f, indent=2)
+# Keywords the validator compiler understands, and annotations it can skip.
+# "min"/"max" are not JSON Schema keywords, so validators ignore them too.
+validatorKeywords = {"type", "const", "enum", "oneOf", "anyOf", "items", "minItems", "maxItems", "properties"}
+validatorAnnotations = {"$schema", "description", "default", "min", "max"}
+
+typeTests = {
+    "number": "{t} is int or {t} is float",
+    "integer": "{t} is int or {t} is float and {v}.is_integer()",
+    "string": "{t} is str",
+    "boolean": "{t} is bool",
+    "array": "{t} is list",
+    "object": "{t} is dict",
+    "null": "{v} is None",
+}
+
+
+def constValues(s):
+    if "const" in s:
+        values = [s["const"]]
+    else:
+        values = s["enum"]
+    if not all(isinstance(value, str) for value in values):
+        raise ValueError("only string const/enum values can be compiled: %r" % values)
+    return values
+
+
+def compileCheck(s, v, depth, indent, lines, calls, knownType=None):
+    pad = "    " * indent
+    t = "t%d" % depth
+
+    if id(s) in calls:
+        lines.append("%sif not %s(%s):" % (pad, calls[id(s)], v))
+        lines.append("%s    return False" % pad)
+        return
+
+    unknown = set(s) - validatorKeywords - validatorAnnotations
+    if unknown:
+        raise ValueError("cannot compile schema keywords %s" % sorted(unknown))
+
+    valueType = s.get("type", knownType)
+    if "type" in s and s["type"] != knownType:
+        lines.append("%s%s = type(%s)" % (pad, t, v))
+        lines.append("%sif not (%s):" % (pad, typeTests[s["type"]].format(t=t, v=v)))
+        lines.append("%s    return False" % pad)
+
+    if "const" in s or "enum" in s:
+        values = ", ".join(repr(value) for value in constValues(s))
+        lines.append("%sif type(%s) is not str or %s not in {%s}:" % (pad, v, v, values))
+        lines.append("%s    return False" % pad)
+
+    if "oneOf" in s:
+        # Distinct string consts can match at most one branch, so oneOf is a set lookup.
+        values = []
+        for branch in s["oneOf"]:
+            if set(branch) - validatorAnnotations != {"const"}:
+                raise ValueError("only oneOf over const values can be compiled")
+            values += constValues(branch)
+        if len(set(values)) != len(values):
+            raise ValueError("oneOf const values must be distinct")
+        lines.append("%sif type(%s) is not str or %s not in {%s}:" % (pad, v, v, ", ".join(repr(value) for value in values)))
+        lines.append("%s    return False" % pad)
+
+    if "anyOf" in s:
+        # Branches are told apart by their type, so only one branch is ever tried.
+        branchTypes = [branch.get("type") for branch in s["anyOf"]]
+        if not all(isinstance(branchType, str) for branchType in branchTypes):
+            raise ValueError("anyOf branches must each declare a single type")
+        numeric = {"number", "integer"}
+        if len(set(branchTypes)) != len(branchTypes) or len(numeric.intersection(branchTypes)) > 1:
+            raise ValueError("anyOf branch types overlap: %s" % branchTypes)
+        lines.append("%s%s = type(%s)" % (pad, t, v))
+        for i, branch in enumerate(s["anyOf"]):
+            keyword = "if" if i == 0 else "elif"
+            lines.append("%s%s %s:" % (pad, keyword, typeTests[branch["type"]].format(t=t, v=v)))
+            start = len(lines)
+            compileCheck(branch, v, depth + 1, indent + 1, lines, calls, branch["type"])
+            if len(lines) == start:
+                lines.append("%s    pass" % pad)
+        lines.append("%selse:" % pad)
+        lines.append("%s    return False" % pad)
+
+    if {"items", "minItems", "maxItems"}.intersection(s):
+        if valueType != "array":
+            raise ValueError("array keywords need \"type\": \"array\"")
+        item = "v%d" % (depth + 1)
+        minItems = s.get("minItems", 0)
+        if "minItems" in s or "maxItems" in s or isinstance(s.get("items"), list):
+            n = "n%d" % depth
+            lines.append("%s%s = len(%s)" % (pad, n, v))
+            bounds = []
+            if "minItems" in s:
+                bounds.append("%s < %d" % (n, s["minItems"]))
+            if "maxItems" in s:
+                bounds.append("%s > %d" % (n, s["maxItems"]))
+            if bounds:
+                lines.append("%sif %s:" % (pad, " or ".join(bounds)))
+                lines.append("%s    return False" % pad)
+        items = s.get("items")
+        if isinstance(items, list):
+            # Tuple form: items past the last listed schema are unconstrained.
+            for i, itemSchema in enumerate(items):
+                itemPad = pad
+                if i >= minItems:
+                    lines.append("%sif %s > %d:" % (pad, n, i))
+                    itemPad = pad + "    "
+                start = len(lines)
+                lines.append("%s%s = %s[%d]" % (itemPad, item, v, i))
+                compileCheck(itemSchema, item, depth + 1, len(itemPad) // 4, lines, calls)
+                if len(lines) == start + 1:
+                    del lines[start:]
+                    if i >= minItems:
+                        lines.pop()
+        elif items is not None:
+            start = len(lines)
+            lines.append("%sfor %s in %s:" % (pad, item, v))
+            compileCheck(items, item, depth + 1, indent + 1, lines, calls)
+            if len(lines) == start + 1:
+                lines.pop()
+
+    if "properties" in s:
+        if valueType != "object":
+            raise ValueError("properties need \"type\": \"object\"")
+        item = "v%d" % (depth + 1)
+        for name, propertySchema in s["properties"].items():
+            start = len(lines)
+            lines.append("%sif %r in %s:" % (pad, name, v))
+            lines.append("%s    %s = %s[%r]" % (pad, item, v, name))
+            compileCheck(propertySchema, item, depth + 1, indent + 1, lines, calls)
+            if len(lines) == start + 2:
+                del lines[start:]
+
+
+def compileFunction(name, s, calls, knownType=None):
+    lines = ["def %s(v):" % name]
+    compileCheck(s, "v", 0, 1, lines, calls, knownType)
+    lines.append("    return True")
+    return "\n".join(lines)
+
+
+def compileObject(name, tableName, checkPrefix, s, calls):
+    # Objects are walked by their own keys and dispatched through a table,
+    # so a small emitter never pays for the ~70 properties it does not set.
+    functions = []
+    table = []
+    for propertyName, propertySchema in s["properties"].items():
+        checkName = checkPrefix + propertyName
+        functions.append(compileFunction(checkName, propertySchema, calls))
+        table.append("    %r: %s," % (propertyName, checkName))
+
+    objectSchema = {key: value for key, value in s.items() if key != "properties"}
+    lines = ["def %s(v):" % name]
+    compileCheck(objectSchema, "v", 0, 1, lines, calls)
+    lines += [
+        "    for key, value in v.items():",
+        "        check = %s.get(key)" % tableName,
+        "        if check is not None and not check(value):",
+        "            return False",
+        "    return True",
+    ]
+    functions.append("%s = {\n%s\n}" % (tableName, "\n".join(table)))
+    functions.append("\n".join(lines))
+    return functions
+
+
+validatorFooter = '''
+def escapePointer(key):
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def iterEmitterErrors(emitter, pointer):
+    if type(emitter) is not dict:
+        yield pointer, "emitter is not an object"
+        return
+    for key, value in emitter.items():
+        check = EMITTER_CHECKS.get(key)
+        if check is not None and not check(value):
+            yield "%s/%s" % (pointer, escapePointer(key)), "invalid value for %r" % key
+
+
+def iterErrors(system):
+    if type(system) is not dict:
+        yield "", "particle system is not an object"
+        return
+    for key, value in system.items():
+        if key == "emitters" and type(value) is list:
+            for i, emitter in enumerate(value):
+                yield from iterEmitterErrors(emitter, "/emitters/%d" % i)
+            continue
+        check = SYSTEM_CHECKS.get(key)
+        if check is not None and not check(value):
+            yield "/" + escapePointer(key), "invalid value for %r" % key
+'''
+
+
+def generateValidator(schema):
+    emitterSchema = schema["properties"]["emitters"]["items"]
+    calls = {id(emitterSchema): "checkEmitter"}
+
+    parts = compileObject("checkEmitter", "EMITTER_CHECKS", "check_", emitterSchema, calls)
+    parts += compileObject("isValid", "SYSTEM_CHECKS", "check_system_", schema, calls)
+
+    header = "# Generated by gen_pfx.py from the particle system schema. Do not edit.\n"
+    return header + "\n\n" + "\n\n\n".join(parts) + "\n\n" + validatorFooter
+
+
+def withoutKeys(s, *keys):
+    return {key: value for key, value in s.items() if key not in keys}
+
+
+def defsRef(defs, name, fragment):
+    if defs.setdefault(name, fragment) != fragment:
+        raise ValueError("conflicting $defs entry %r" % name)
+    return {"$ref": "#/$defs/" + name}
+
+
+def hoistCurve(defs, timeName, timeType, valueType):
+    valueType = withoutKeys(valueType, "description", "default")
+    name = timeName + valueType["type"].capitalize() + "Curve"
+
+    curveArray = defsRef(defs, name + "Array", hoistDefs(timeCurveArray(timeType, valueType), defs))
+    curveObject = timeCurveObject(timeType, valueType)
+    curveObject["properties"]["keys"] = curveArray
+    curveObject = defsRef(defs, name + "Object", curveObject)
+
+    return defsRef(defs, name, {"anyOf": [valueType, curveArray, curveObject]})
+
+
+def hoistDefs(node, defs):
+    # Replace the fragments the helpers above stamp out per property with
+    # $refs. Descriptions and defaults stay at the use site.
+    if isinstance(node, list):
+        return [hoistDefs(item, defs) for item in node]
+    if not isinstance(node, dict):
+        return node
+
+    useSite = {key: node[key] for key in ("default", "description") if key in node}
+    shape = withoutKeys(node, "default")
+
+    for timeName, timeType in (("emitterTime", emitterTime()), ("particleTime", particleTime())):
+        if node == timeType:
+            return defsRef(defs, timeName, timeType)
+        anyOf = node.get("anyOf")
+        if anyOf and len(anyOf) == 3 and shape == timeCurve(timeType, anyOf[0]):
+            return merge(useSite, hoistCurve(defs, timeName, timeType, anyOf[0]))
+
+    if node == emitterTypeProperty():
+        fragment = withoutKeys(node, "default", "description")
+        return merge(useSite, defsRef(defs, "emitterType", fragment))
+
+    if "anyOf" in node and shape == bursts(node.get("description")):
+        burstList = bursts(None)["anyOf"][1]
+        burstList["items"] = defsRef(defs, "burst", hoistDefs(burstList["items"], defs))
+        fragment = {"anyOf": [bursts(None)["anyOf"][0], burstList]}
+        return merge(useSite, defsRef(defs, "bursts", fragment))
+
+    return {key: hoistDefs(value, defs) for key, value in node.items()}
+
+
+def schemaWithDefs(schema):
+    defs = {}
+    hoisted = hoistDefs(schema, defs)
+    hoisted["$defs"] = dict(sorted(defs.items()))
+    return hoisted
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate the particle system schema and validator.")
+    parser.add_argument("--defs", action="store_true", help="hoist shared curve, time, burst and emitter type fragments into $defs")
+    args = parser.parse_args()
+
+    with open("pfx-schema", "w") as f:
+        json.dump(schemaWithDefs(schema) if args.defs else schema, f, indent=2)
+
+    with open("pfx_validator.py", "w", newline="\n") as f:
+        f.write(generateValidator(schema))
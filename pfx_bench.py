@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import platform
+import random
+import runpy
+import time
+
+import numpy as np
+
+import pfx_validator
+from gen_pfx import generateValidator, schema
+from pfx_curve import normalizeCurve, sampleCurve
+from pfx_emitter import emitterProperties, propertyKinds, timeCurveProperties
+
+
+here = os.path.dirname(os.path.abspath(__file__))
+emitterTypes = [branch["const"] for branch in emitterProperties["type"]["oneOf"]]
+
+
+def syntheticKeys(rng):
+    count = rng.choice([2, 3, 5, 8, 16, 64])
+    times = sorted(rng.uniform(0, 2) for _ in range(count))
+    return [[round(t, 4), round(rng.uniform(-5, 5), 4)] for t in times]
+
+
+def syntheticCurve(rng):
+    form = rng.randrange(4)
+    if form == 0:
+        return round(rng.uniform(-5, 5), 4)
+    if form == 1:
+        return syntheticKeys(rng)
+    return {"keys": syntheticKeys(rng), "stepped": form == 3}
+
+
+def syntheticBursts(rng):
+    form = rng.randrange(3)
+    if form == 0:
+        return rng.randrange(1, 50)
+    bursts = []
+    for _ in range(rng.randrange(1, 6)):
+        time = round(rng.uniform(0, 2), 3)
+        if form == 1:
+            burst = [time, rng.randrange(1, 50), rng.randrange(0, 10), round(rng.random(), 2)]
+            bursts.append(burst[:rng.randrange(2, 5)])
+        else:
+            bursts.append({"time": time, "count": rng.randrange(1, 50), "countRange": rng.randrange(0, 10), "chance": round(rng.random(), 2)})
+    return bursts
+
+
+def syntheticValue(rng, name):
+    kind = propertyKinds[name]
+    if name == "emissionBursts":
+        return syntheticBursts(rng)
+    if kind == "curve":
+        return syntheticCurve(rng)
+    if isinstance(kind, list):
+        return rng.choice(kind)
+    if kind == "boolean":
+        return rng.random() < 0.5
+    if kind == "integer":
+        return rng.randrange(0, 4)
+    if kind == "number":
+        return round(rng.uniform(0, 5), 3)
+    return emitterProperties[name]["default"]
+
+
+def syntheticEmitter(rng, index):
+    # Every emitter type and curve form shows up, with a realistic handful
+    # of properties set on each emitter.
+    names = rng.sample(list(emitterProperties), rng.randrange(4, 24))
+    emitter = {name: syntheticValue(rng, name) for name in names}
+    emitter["type"] = emitterTypes[index % len(emitterTypes)]
+    return emitter
+
+
+def linkEmitters(rng, emitters):
+    # EMITTER-type emitters follow an earlier emitter of another type, so
+    # every link graph is valid and acyclic. One with nothing before it to
+    # follow becomes a POSITION emitter.
+    roots = []
+    for i, emitter in enumerate(emitters):
+        if emitter["type"] != "EMITTER":
+            roots.append(i)
+        elif roots:
+            emitter["linkIndex"] = rng.choice(roots)
+        else:
+            emitter["type"] = "POSITION"
+
+
+def syntheticCorpus(emitterCount, seed=0, maxEmitters=8):
+    rng = random.Random(seed)
+    systems = []
+    made = 0
+    while made < emitterCount:
+        count = min(rng.randrange(1, maxEmitters + 1), emitterCount - made)
+        system = {"emitters": [syntheticEmitter(rng, made + i) for i in range(count)]}
+        linkEmitters(rng, system["emitters"])
+        if rng.random() < 0.3:
+            system["color"] = [round(rng.random(), 3) for _ in range(4)]
+        systems.append(system)
+        made += count
+    return systems
+
+
+def timeIt(function, repeat):
+    # Best of `repeat` runs, which is the least noisy number to compare.
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchSchemaGeneration(repeat):
+    script = os.path.join(here, "gen_pfx.py")
+    return {
+        "schema": timeIt(lambda: runpy.run_path(script, run_name="pfx_bench"), repeat),
+        "dump": timeIt(lambda: json.dumps(schema, indent=2), repeat),
+        "validator": timeIt(lambda: generateValidator(schema), repeat),
+    }
+
+
+def benchSchemaLoad(repeat):
+    with open(os.path.join(here, "pfx-schema"), "rb") as f:
+        text = f.read()
+    source = generateValidator(schema)
+    results = {
+        "load": timeIt(lambda: json.loads(text), repeat),
+        "compileValidator": timeIt(lambda: exec(compile(source, "pfx_validator.py", "exec"), {}), repeat),
+    }
+    try:
+        import jsonschema
+    except ImportError:
+        return results
+    document = {"emitters": [{name: p["default"] for name, p in emitterProperties.items() if p["default"] is not None}]}
+    results["jsonschema"] = timeIt(lambda: jsonschema.Draft7Validator(json.loads(text)).is_valid(document), repeat)
+    return results
+
+
+def benchValidation(texts, repeat):
+    def parse():
+        for text in texts:
+            json.loads(text)
+
+    def validate():
+        for text in texts:
+            pfx_validator.isValid(json.loads(text))
+
+    parsed = [json.loads(text) for text in texts]
+    return {
+        "parse": timeIt(parse, repeat),
+        "parseAndValidate": timeIt(validate, repeat),
+        "validate": timeIt(lambda: all(map(pfx_validator.isValid, parsed)), repeat),
+    }
+
+
+def benchCurves(systems, samples, repeat):
+    values = [emitter[name] for system in systems for emitter in system["emitters"] for name in timeCurveProperties if name in emitter]
+    t = np.linspace(0, 2, samples)
+
+    def normalize():
+        for value in values:
+            normalizeCurve(value)
+
+    curves = [normalizeCurve(value) for value in values]
+
+    def sample():
+        for curve in curves:
+            sampleCurve(curve, t)
+
+    return {
+        "curves": len(curves),
+        "normalize": timeIt(normalize, repeat),
+        "sample": timeIt(sample, repeat),
+    }
+
+
+def compare(old, new):
+    # Prints new/old for every timing that appears in both reports.
+    for section, results in new["results"].items():
+        for name, seconds in results.items():
+            before = old.get("results", {}).get(section, {}).get(name)
+            if isinstance(seconds, float) and isinstance(before, float) and before > 0:
+                print("%-32s %10.4fs %10.4fs %7.2fx" % ("%s.%s" % (section, name), before, seconds, seconds / before))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark schema generation, validation and curve sampling on a synthetic corpus.")
+    parser.add_argument("-n", "--emitters", type=int, default=10000, help="number of emitters in the synthetic corpus")
+    parser.add_argument("--seed", type=int, default=0, help="corpus random seed")
+    parser.add_argument("--samples", type=int, default=1000, help="sample times per curve")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per timing; the best is reported")
+    parser.add_argument("--write", metavar="DIR", help="also write the corpus as .pfx files to DIR")
+    parser.add_argument("-o", "--output", help="write the JSON results here instead of stdout")
+    parser.add_argument("--compare", metavar="JSON", help="print ratios against an earlier results file")
+    args = parser.parse_args()
+
+    systems = syntheticCorpus(args.emitters, args.seed)
+    texts = [json.dumps(system, indent=2) for system in systems]
+    if args.write:
+        os.makedirs(args.write, exist_ok=True)
+        for i, text in enumerate(texts):
+            with open(os.path.join(args.write, "synthetic_%06d.pfx" % i), "w") as f:
+                f.write(text)
+
+    report = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "corpus": {
+            "seed": args.seed,
+            "emitters": args.emitters,
+            "files": len(systems),
+            "bytes": sum(len(text) for text in texts),
+        },
+        "results": {
+            "generate": benchSchemaGeneration(args.repeat),
+            "schema": benchSchemaLoad(args.repeat),
+            "validation": benchValidation(texts, args.repeat),
+            "curves": benchCurves(systems, args.samples, args.repeat),
+        },
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import zlib
+
+import numpy as np
+
+from pfx_emitter import emitterProperties, emitterValue, propertyKinds
+
+
+# File layout, all little endian:
+#
+#   header     magic, version, property count and hash, emitter count, and
+#              the offsets of the sections below
+#   emitters   one tableEntry per emitter
+#   records    per emitter, a presence bitmask over the schema property
+#              order followed by one 16 byte slot per present property
+#   floats     every curve's keys as contiguous float64 (t, v) pairs
+#   blobs      JSON text for anything without a packed encoding
+#
+# Properties the emitter reads the same without are left out of the record.
+
+magic = b"PFXB"
+version = 1
+
+headerFormat = struct.Struct("<4sHHIIQQQQQQ")
+tableEntry = np.dtype([("record", "<u8"), ("slots", "<u4"), ("extraSize", "<u4"), ("extra", "<u8")])
+slot = np.dtype([("tag", "u1"), ("flags", "u1"), ("pad", "<u2"), ("count", "<u4"), ("payload", "<u8")])
+
+NUMBER, INTEGER, BOOLEAN, ENUM, KEYS, KEYS_OBJECT, JSON = range(7)
+
+# KEYS_OBJECT flags
+HAS_KEYS, HAS_STEPPED, STEPPED = 1, 2, 4
+
+# Emitters that are not objects are stored whole as a JSON blob, as is a
+# system without an emitter list.
+RAW_EMITTER = 0xFFFFFFFF
+NO_EMITTERS = 0xFFFFFFFF
+
+propertyNames = list(emitterProperties)
+propertyIndex = {name: i for i, name in enumerate(propertyNames)}
+propertyHash = zlib.crc32("\n".join(propertyNames).encode())
+maskBytes = (len(propertyNames) + 63) // 64 * 8
+
+
+def isNumber(value):
+    return type(value) in (int, float)
+
+
+def isKeys(value):
+    return isinstance(value, list) and all(
+        isinstance(key, list) and len(key) == 2 and isNumber(key[0]) and isNumber(key[1]) for key in value
+    )
+
+
+def sameValue(a, b):
+    return type(a) is type(b) and a == b
+
+
+def defaultNames(emitter):
+    # The properties that can be left out without changing anything the
+    # emitter reads. Each is checked against what is left once the earlier
+    # ones are gone, since leaving out emissionBursts also moves the
+    # emissionRate default from 0 back to 20.
+    rest = dict(emitter)
+    names = set()
+    for name in emitter:
+        if name not in propertyIndex:
+            continue
+        value = rest.pop(name)
+        if all(sameValue(emitterValue(emitter, key), emitterValue(rest, key)) for key in (name, "emissionRate")):
+            names.add(name)
+        else:
+            rest[name] = value
+    return names
+
+
+class Writer:
+    def __init__(self):
+        self.floats = []
+        self.floatCount = 0
+        self.blobs = bytearray()
+
+    def blob(self, value):
+        data = json.dumps(value, separators=(",", ":")).encode()
+        offset = len(self.blobs)
+        self.blobs += data
+        return offset, len(data)
+
+    def keys(self, keys):
+        offset = self.floatCount
+        self.floats.append(np.asarray(keys, dtype="<f8").reshape(-1))
+        self.floatCount += 2 * len(keys)
+        return offset
+
+    def encodeValue(self, name, value):
+        # Returns (tag, flags, count, payload) for one property value.
+        kind = propertyKinds[name]
+        if kind == "curve":
+            if isNumber(value):
+                return NUMBER, 0, 0, struct.unpack("<Q", struct.pack("<d", value))[0]
+            if isKeys(value):
+                return KEYS, 0, len(value), self.keys(value)
+            if isinstance(value, dict) and set(value) <= {"keys", "stepped"}:
+                keys = value.get("keys", [])
+                stepped = value.get("stepped", False)
+                if isKeys(keys) and type(stepped) is bool:
+                    flags = (HAS_KEYS if "keys" in value else 0) | (HAS_STEPPED if "stepped" in value else 0) | (STEPPED if stepped else 0)
+                    return KEYS_OBJECT, flags, len(keys), self.keys(keys)
+        elif kind == "number" and isNumber(value):
+            return NUMBER, 0, 0, struct.unpack("<Q", struct.pack("<d", value))[0]
+        elif kind == "integer" and type(value) is int and -2 ** 63 <= value < 2 ** 63:
+            return INTEGER, 0, 0, value & 0xFFFFFFFFFFFFFFFF
+        elif kind == "boolean" and type(value) is bool:
+            return BOOLEAN, 0, 0, int(value)
+        elif isinstance(kind, list) and value in kind and type(value) is str:
+            return ENUM, 0, 0, kind.index(value)
+        offset, size = self.blob(value)
+        return JSON, 0, size, offset
+
+    def encodeEmitter(self, emitter):
+        mask = bytearray(maskBytes)
+        slots = []
+        extra = {}
+        defaults = defaultNames(emitter)
+        for name in sorted(emitter, key=lambda key: propertyIndex.get(key, -1)):
+            if name not in propertyIndex:
+                extra[name] = emitter[name]
+                continue
+            if name in defaults:
+                continue
+            i = propertyIndex[name]
+            mask[i // 8] |= 1 << (i % 8)
+            slots.append(self.encodeValue(name, emitter[name]))
+        record = np.zeros(len(slots), dtype=slot)
+        for i, (tag, flags, count, payload) in enumerate(slots):
+            record[i] = (tag, flags, 0, count, payload)
+        return bytes(mask) + record.tobytes(), len(slots), extra
+
+
+def encodeSystem(system):
+    writer = Writer()
+    emitters = system.get("emitters") if isinstance(system, dict) else None
+    if isinstance(emitters, list):
+        rest = {key: value for key, value in system.items() if key != "emitters"}
+        emitterCount = len(emitters)
+    else:
+        emitters = []
+        rest = system
+        emitterCount = NO_EMITTERS
+    restOffset, restSize = writer.blob(rest)
+
+    table = np.zeros(len(emitters), dtype=tableEntry)
+    records = bytearray()
+    for i, emitter in enumerate(emitters):
+        if isinstance(emitter, dict):
+            record, slots, extra = writer.encodeEmitter(emitter)
+        else:
+            record, slots, extra = b"", RAW_EMITTER, emitter
+        extraOffset, extraSize = writer.blob(extra) if extra or slots == RAW_EMITTER else (0, 0)
+        table[i] = (len(records), slots, extraSize, extraOffset)
+        records += record
+
+    floats = np.concatenate(writer.floats) if writer.floats else np.zeros(0, dtype="<f8")
+
+    tableOffset = headerFormat.size
+    recordsOffset = tableOffset + table.nbytes
+    floatsOffset = (recordsOffset + len(records) + 7) // 8 * 8
+    blobsOffset = floatsOffset + floats.nbytes
+    header = headerFormat.pack(
+        magic, version, len(propertyNames), propertyHash, emitterCount,
+        recordsOffset, floatsOffset, len(floats), blobsOffset, restOffset, restSize,
+    )
+    padding = bytes(floatsOffset - recordsOffset - len(records))
+    return header + table.tobytes() + bytes(records) + padding + floats.tobytes() + bytes(writer.blobs)
+
+
+def writeBinary(system, path):
+    with open(path, "wb") as f:
+        f.write(encodeSystem(system))
+
+
+class EmitterView:
+    # Decodes one emitter on demand. Curve keys come back as (n, 2) views
+    # straight into the mapped file.
+    def __init__(self, pfx, index):
+        self.pfx = pfx
+        entry = pfx.table[index]
+        self.entry = entry
+        self.raw = int(entry["slots"]) == RAW_EMITTER
+        self.slots = {}
+        if self.raw:
+            return
+        start = pfx.recordsOffset + int(entry["record"])
+        mask = np.frombuffer(pfx.buffer, dtype="u1", count=maskBytes, offset=start)
+        present = np.flatnonzero(np.unpackbits(mask, bitorder="little")[:len(propertyNames)])
+        values = np.frombuffer(pfx.buffer, dtype=slot, count=int(entry["slots"]), offset=start + maskBytes)
+        self.slots = {propertyNames[i]: values[n] for n, i in enumerate(present)}
+
+    def keys(self):
+        return list(self.slots) + list(self.extra())
+
+    def extra(self):
+        if not self.entry["extraSize"]:
+            return {}
+        return self.pfx.blob(int(self.entry["extra"]), int(self.entry["extraSize"]))
+
+    def curve(self, name):
+        # The keys of a curve property, or None if it is a scalar or unset.
+        value = self.slots.get(name)
+        if value is None or value["tag"] not in (KEYS, KEYS_OBJECT):
+            return None
+        return self.pfx.floats[int(value["payload"]):int(value["payload"]) + 2 * int(value["count"])].reshape(-1, 2)
+
+    def get(self, name, default=None):
+        value = self.slots.get(name)
+        if value is None:
+            return self.extra().get(name, default)
+        tag, flags, count, payload = int(value["tag"]), int(value["flags"]), int(value["count"]), int(value["payload"])
+        if tag == NUMBER:
+            return struct.unpack("<d", struct.pack("<Q", payload))[0]
+        if tag == INTEGER:
+            return payload - (1 << 64) if payload >= 1 << 63 else payload
+        if tag == BOOLEAN:
+            return bool(payload)
+        if tag == ENUM:
+            return propertyKinds[name][payload]
+        if tag == JSON:
+            return self.pfx.blob(payload, count)
+        keys = self.curve(name).tolist()
+        if tag == KEYS:
+            return keys
+        curve = {}
+        if flags & HAS_KEYS:
+            curve["keys"] = keys
+        if flags & HAS_STEPPED:
+            curve["stepped"] = bool(flags & STEPPED)
+        return curve
+
+    def toJson(self):
+        if self.raw:
+            return self.extra()
+        emitter = {name: self.get(name) for name in self.slots}
+        emitter.update(self.extra())
+        return emitter
+
+
+class PfxBinary:
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (
+            fileMagic, fileVersion, propertyCount, fileHash, self.emitterCount,
+            self.recordsOffset, floatsOffset, floatCount, self.blobsOffset, self.restOffset, self.restSize,
+        ) = headerFormat.unpack_from(self.buffer)
+        if fileMagic != magic or fileVersion != version:
+            raise ValueError("%s is not a version %d pfx binary" % (path, version))
+        if propertyCount != len(propertyNames) or fileHash != propertyHash:
+            raise ValueError("%s was written for a different emitter property list" % path)
+        self.hasEmitters = self.emitterCount != NO_EMITTERS
+        if not self.hasEmitters:
+            self.emitterCount = 0
+        self.table = np.frombuffer(self.buffer, dtype=tableEntry, count=self.emitterCount, offset=headerFormat.size)
+        self.floats = np.frombuffer(self.buffer, dtype="<f8", count=floatCount, offset=floatsOffset)
+
+    def __len__(self):
+        return self.emitterCount
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        # Views handed out by curve() or held by an EmitterView keep the
+        # mapping open. It is then unmapped once the last of them is
+        # garbage collected.
+        self.table = self.floats = None
+        try:
+            self.buffer.close()
+        except BufferError:
+            pass
+        self.buffer = None
+
+    def blob(self, offset, size):
+        start = self.blobsOffset + offset
+        return json.loads(self.buffer[start:start + size])
+
+    def emitter(self, index):
+        return EmitterView(self, index)
+
+    def toJson(self):
+        system = self.blob(self.restOffset, self.restSize)
+        if self.hasEmitters:
+            system["emitters"] = [self.emitter(i).toJson() for i in range(self.emitterCount)]
+        return system
+
+
+def effectiveSystem(system):
+    # What the game reads from a system: every schema property of every
+    # emitter at its effective value, plus everything else as written.
+    if not isinstance(system, dict) or not isinstance(system.get("emitters"), list):
+        return system
+    emitters = []
+    for emitter in system["emitters"]:
+        if isinstance(emitter, dict):
+            emitter = dict(emitter, **{name: emitterValue(emitter, name) for name in propertyNames})
+        emitters.append(emitter)
+    return dict(system, emitters=emitters)
+
+
+def roundTrips(system, path):
+    # Compared by effective value, so leaving out a default passes but
+    # leaving out something the emitter reads differently without fails.
+    writeBinary(system, path)
+    with PfxBinary(path) as pfx:
+        return effectiveSystem(pfx.toJson()) == effectiveSystem(system)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert .pfx files to and from the packed binary format.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    pack = commands.add_parser("pack", help="write the binary form of a .pfx file")
+    pack.add_argument("source")
+    pack.add_argument("target")
+    unpack = commands.add_parser("unpack", help="print a binary file as JSON")
+    unpack.add_argument("source")
+    check = commands.add_parser("check", help="verify that .pfx files survive a round trip")
+    check.add_argument("paths", nargs="+")
+    args = parser.parse_args()
+
+    if args.command == "pack":
+        with open(args.source, encoding="utf-8-sig") as f:
+            writeBinary(json.load(f), args.target)
+    elif args.command == "unpack":
+        with PfxBinary(args.source) as pfx:
+            json.dump(pfx.toJson(), sys.stdout, indent=2)
+        print()
+    else:
+        failed = 0
+        with tempfile.TemporaryDirectory() as scratch:
+            for path in args.paths:
+                with open(path, encoding="utf-8-sig") as f:
+                    system = json.load(f)
+                if not roundTrips(system, os.path.join(scratch, "roundtrip.pfxb")):
+                    print("%s: round trip changed the effect" % path)
+                    failed += 1
+        return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import math
+import sys
+
+import numpy as np
+
+import pfx_links
+from pfx_curve import Curve, curveKnots, integrateCurve, normalizeCurve, sampleCurve
+from pfx_emitter import emitterDefaults, emitterValue, loopTiming, normalizeBursts
+
+
+def emitterCurve(emitter, name):
+    return normalizeCurve(emitterValue(emitter, name), emitterDefaults[name])
+
+
+def positive(curve):
+    # Negative rates spawn nothing. Clipping the keys bounds the clipped
+    # curve from above, since a clipped linear segment is convex.
+    return Curve(curve.times, np.maximum(curve.values, 0.0), curve.stepped)
+
+
+def maxLifetime(emitter, start, end):
+    lifetime = emitterCurve(emitter, "lifetime")
+    lifetimeRange = emitterCurve(emitter, "lifetimeRange")
+    t = curveKnots([lifetime, lifetimeRange], start, end)
+    return max(float(np.max(sampleCurve(lifetime, t) + np.abs(sampleCurve(lifetimeRange, t)))), 0.0)
+
+
+def burstTotal(bursts, start, end):
+    inside = (bursts[:, 0] >= start) & (bursts[:, 0] < end) & (bursts[:, 3] > 0)
+    return float(np.sum(np.maximum(bursts[inside, 1] + np.abs(bursts[inside, 2]), 0)))
+
+
+def emitterCost(emitter):
+    # Analytic upper bounds on what one emitter can spawn, ignoring
+    # maxParticles. Linked EMITTER-type emitters are bounded per parent.
+    startLoop, endLoop, passes = loopTiming(emitter)
+    firstStart = min(0.0, startLoop)
+    rate = positive(emitterCurve(emitter, "emissionRate"))
+    bursts = normalizeBursts(emitterValue(emitter, "emissionBursts"))
+    lifetime = maxLifetime(emitter, firstStart, endLoop)
+
+    firstPass = integrateCurve(rate, 0.0, endLoop) + burstTotal(bursts, 0.0, endLoop)
+    loopPass = integrateCurve(rate, startLoop, endLoop) + burstTotal(bursts, startLoop, endLoop)
+    if passes == math.inf:
+        total = math.inf if loopPass > 0 else firstPass
+    else:
+        total = firstPass + (passes - 1) * loopPass
+
+    # A particle alive at time T spawned within the last `lifetime` seconds.
+    # That window holds at most peakRate * lifetime rate particles (plus one
+    # for fractional carry), and bursts from as many passes as it can span.
+    peakRate = float(np.max(sampleCurve(rate, curveKnots([rate], firstStart, endLoop))))
+    period = endLoop - startLoop
+    spanned = 1 if passes == 1 else min(passes, math.floor(lifetime / period) + 2)
+    window = peakRate * lifetime + 1 + burstTotal(bursts, firstStart, endLoop) * spanned
+    peak = int(math.ceil(min(window, total)))
+
+    delay = emitterValue(emitter, "delay")
+    delayRange = abs(emitterValue(emitter, "delayRange"))
+    if passes == math.inf:
+        activeUntil = math.inf
+    else:
+        activeUntil = delay + delayRange + endLoop + (passes - 1) * period + lifetime
+
+    maxParticles = emitterValue(emitter, "maxParticles")
+    warnings = []
+    if emitterValue(emitter, "snapToSurface"):
+        warnings.append("snapToSurface traces against the planet for every spawned particle")
+    if maxParticles is not None and maxParticles < peak:
+        warnings.append("maxParticles %g is below the predicted peak of %d; spawns will be dropped" % (maxParticles, peak))
+    if emitterValue(emitter, "type") == "EMITTER":
+        warnings.append("linked to emitter %d; counts are per parent particle" % emitterValue(emitter, "linkIndex"))
+
+    return {
+        "type": emitterValue(emitter, "type"),
+        "maxLifetime": lifetime,
+        "passes": passes,
+        "spawnedPerPass": firstPass,
+        "spawnedTotal": total,
+        "smartMaxParticles": peak,
+        "maxParticles": maxParticles,
+        "peakLive": peak if maxParticles is None else min(peak, max(int(maxParticles), 0)),
+        "activeFrom": max(delay - delayRange, 0.0),
+        "activeUntil": activeUntil,
+        "warnings": warnings,
+    }
+
+
+def systemCost(system):
+    emitters = system.get("emitters", [])
+    costs = [emitterCost(emitter) for emitter in emitters]
+
+    # A linked emitter runs once per live parent particle, so its bound is
+    # the chain peak from pfx_links, and it is active whenever its parent
+    # can have live particles. Its own active span counts from a parent
+    # particle's spawn.
+    links = pfx_links.compileLinks(emitters)
+    peaks = pfx_links.chainPeaks(emitters, links)[0]
+    for i in links["order"]:
+        parent = links["parents"][i]
+        if parent >= 0:
+            costs[i]["activeFrom"] += costs[parent]["activeFrom"]
+            costs[i]["activeUntil"] += costs[parent]["activeUntil"]
+            costs[i]["peakLive"] = peaks[i]
+    emitters = costs
+
+    # Emitters whose active spans never overlap cannot peak together, so the
+    # system bound is the largest sum over emitters active at the same time.
+    peak = 0
+    for emitter in emitters:
+        t = emitter["activeFrom"]
+        active = [e["peakLive"] for e in emitters if e["activeFrom"] <= t <= e["activeUntil"]]
+        peak = max(peak, sum(active))
+
+    return {
+        "emitters": emitters,
+        "peakLive": peak,
+        "spawnedTotal": sum(emitter["spawnedTotal"] for emitter in emitters),
+        "linkErrors": links["errors"],
+    }
+
+
+def jsonNumber(value):
+    # Infinite bounds are reported as null to keep the report strict JSON.
+    if isinstance(value, float) and math.isinf(value):
+        return None
+    if isinstance(value, dict):
+        return {key: jsonNumber(v) for key, v in value.items()}
+    if isinstance(value, list):
+        return [jsonNumber(v) for v in value]
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report analytic particle count bounds for .pfx files.")
+    parser.add_argument("paths", nargs="+", help=".pfx files to analyze")
+    parser.add_argument("--budget", type=int, help="fail if a system's peak live particle bound exceeds this")
+    parser.add_argument("--emitter-budget", type=int, help="fail if an emitter's peak live particle bound exceeds this")
+    args = parser.parse_args()
+
+    report = {}
+    failed = False
+    for path in args.paths:
+        with open(path, encoding="utf-8-sig") as f:
+            cost = systemCost(json.load(f))
+        failures = []
+        if args.budget is not None and cost["peakLive"] > args.budget:
+            failures.append("system peak %d exceeds budget %d" % (cost["peakLive"], args.budget))
+        for i, emitter in enumerate(cost["emitters"]):
+            if args.emitter_budget is not None and emitter["peakLive"] > args.emitter_budget:
+                failures.append("emitter %d peak %d exceeds budget %d" % (i, emitter["peakLive"], args.emitter_budget))
+        cost["budgetFailures"] = failures
+        failed = failed or bool(failures)
+        report[path] = jsonNumber(cost)
+
+    json.dump(report, sys.stdout, indent=2)
+    print()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+from collections import namedtuple
+
+import numpy as np
+
+
+# A time curve packed into contiguous float64 arrays. Constant curves are a
+# single key at time 0.
+Curve = namedtuple("Curve", ["times", "values", "stepped"])
+
+
+def constantCurve(value):
+    return Curve(np.zeros(1), np.array([float(value)]), False)
+
+
+def keysCurve(keys, stepped=False, default=0.0):
+    keys = np.asarray(keys, dtype=np.float64).reshape(-1, 2)
+    if len(keys) == 0:
+        return constantCurve(default)
+    # Keyframes are authored in order, but a stable sort keeps ties in file order.
+    order = np.argsort(keys[:, 0], kind="stable")
+    keys = keys[order]
+    return Curve(np.ascontiguousarray(keys[:, 0]), np.ascontiguousarray(keys[:, 1]), bool(stepped))
+
+
+def normalizeCurve(value, default=0.0):
+    # Accepts every form timeCurve() allows: a number, [[t, v], ...], or
+    # {"keys": [[t, v], ...], "stepped": bool}.
+    if value is None:
+        return constantCurve(default)
+    if isinstance(value, Curve):
+        return value
+    if isinstance(value, dict):
+        return keysCurve(value.get("keys", []), value.get("stepped", False), default)
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return keysCurve(value, False, default)
+    return constantCurve(value)
+
+
+def isConstant(curve):
+    return len(curve.values) == 1 or bool(np.all(curve.values == curve.values[0]))
+
+
+def sampleCurve(curve, t):
+    # Times outside the keys clamp to the first or last value.
+    t = np.asarray(t, dtype=np.float64)
+    if len(curve.values) == 1:
+        return np.full(t.shape, curve.values[0])
+    if curve.stepped:
+        index = np.searchsorted(curve.times, t, side="right") - 1
+        return curve.values[np.clip(index, 0, len(curve.values) - 1)]
+    return np.interp(t, curve.times, curve.values)
+
+
+def curveRange(curve):
+    return float(curve.times[0]), float(curve.times[-1])
+
+
+def bakeCurve(curve, resolution=256, start=None, end=None):
+    # Sample the curve once into a lookup table covering [start, end].
+    first, last = curveRange(curve)
+    start = first if start is None else start
+    end = last if end is None else end
+    return sampleCurve(curve, np.linspace(start, end, resolution))
+
+
+def sampleTable(table, start, end, t, stepped=False):
+    # Linear lookup into a baked table, clamped at both ends. A table baked
+    # from a stepped curve holds each entry until the next one instead.
+    t = np.asarray(t, dtype=np.float64)
+    if end <= start or len(table) == 1:
+        return np.full(t.shape, table[0])
+    position = np.clip((t - start) * ((len(table) - 1) / (end - start)), 0, len(table) - 1)
+    if stepped:
+        # The epsilon keeps rounding from stepping back at exact sample times.
+        return table[np.floor(position + 1e-9).astype(np.intp)]
+    index = np.minimum(position.astype(np.intp), len(table) - 2)
+    fraction = position - index
+    return table[index] * (1.0 - fraction) + table[index + 1] * fraction
+
+
+def curveKnots(curves, start, end):
+    # Every key time inside [start, end] plus both ends. Linear and stepped
+    # curves only change slope or value at these times.
+    times = [np.array([start, end], dtype=np.float64)]
+    times += [curve.times[(curve.times > start) & (curve.times < end)] for curve in curves]
+    return np.unique(np.concatenate(times))
+
+
+def integrateCurve(curve, start, end):
+    # Exact integral of the curve over emitter time [start, end].
+    if end <= start:
+        return 0.0
+    if len(curve.values) == 1:
+        return float(curve.values[0]) * (end - start)
+    t = curveKnots([curve], start, end)
+    v = sampleCurve(curve, t)
+    if curve.stepped:
+        return float(np.sum(v[:-1] * np.diff(t)))
+    return float(np.sum(0.5 * (v[:-1] + v[1:]) * np.diff(t)))
+
+
+def simplifyKeys(times, values, stepped, tolerance):
+    # Returns the indices of the keys to keep so that the curve never moves
+    # more than `tolerance` from the original. The first and last keys are
+    # always kept, as are keys sharing a time (jumps) on linear curves.
+    times = np.asarray(times, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    n = len(times)
+    if n <= 2:
+        return np.arange(n)
+
+    if stepped:
+        # A stepped key only matters if it changes the held value. The last
+        # key is kept anyway, since it sets the curve's time range.
+        keep = [0]
+        for i in range(1, n):
+            if abs(values[i] - values[keep[-1]]) > tolerance or i == n - 1:
+                keep.append(i)
+        return np.array(keep)
+
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    jumps = times[:-1] == times[1:]
+    keep[:-1] |= jumps
+    keep[1:] |= jumps
+    anchors = np.flatnonzero(keep)
+
+    # Ramer-Douglas-Peucker on vertical error. Both curves are piecewise
+    # linear, so the error is largest at one of the original keys.
+    spans = list(zip(anchors[:-1], anchors[1:]))
+    while spans:
+        a, b = spans.pop()
+        if b - a < 2:
+            continue
+        t = times[a + 1:b]
+        line = values[a] + (values[b] - values[a]) * (t - times[a]) / (times[b] - times[a])
+        error = np.abs(values[a + 1:b] - line)
+        i = int(np.argmax(error))
+        if error[i] > tolerance:
+            m = a + 1 + i
+            keep[m] = True
+            spans += [(a, m), (m, b)]
+    return np.flatnonzero(keep)
@@ -0,0 +1,68 @@
+import math
+
+import numpy as np
+
+from gen_pfx import schema
+
+
+emitterProperties = schema["properties"]["emitters"]["items"]["properties"]
+emitterDefaults = {name: p["default"] for name, p in emitterProperties.items()}
+
+
+def emitterValue(emitter, name):
+    if name == "emissionRate" and name not in emitter and "emissionBursts" in emitter:
+        return 0.0
+    return emitter.get(name, emitterDefaults[name])
+
+
+def normalizeBursts(value):
+    # Returns an (n, 4) array of time, count, countRange and chance, sorted
+    # by time, for every form bursts() allows.
+    if not isinstance(value, list):
+        value = [[0.0, value]] if value else []
+    bursts = []
+    for burst in value:
+        if isinstance(burst, dict):
+            burst = [burst.get("time", 0.0), burst.get("count", 0), burst.get("countRange", 0), burst.get("chance", 1.0)]
+        burst = list(burst) + [0, 1.0][len(burst) - 2:]
+        bursts.append(burst[:4])
+    bursts = np.array(bursts, dtype=np.float64).reshape(-1, 4)
+    return bursts[np.argsort(bursts[:, 0], kind="stable")]
+
+
+def loopTiming(emitter):
+    # Returns (startLoop, endLoop, passes). The first pass runs from 0 to
+    # endLoop and every later pass from startLoop to endLoop. passes is
+    # math.inf for an emitter that loops forever.
+    lifetime = emitterValue(emitter, "emitterLifetime")
+    endLoop = emitterValue(emitter, "endLoop")
+    if endLoop <= 0 or endLoop > lifetime:
+        endLoop = lifetime
+    startLoop = emitterValue(emitter, "startLoop")
+    loopCount = emitterValue(emitter, "loopCount")
+    looping = emitterValue(emitter, "bLoop") and endLoop > startLoop
+    passes = (loopCount or math.inf) if looping else 1
+    return startLoop, endLoop, passes
+
+
+def isTimeCurve(propertySchema):
+    return any(
+        branch.get("type") == "object" and "keys" in branch.get("properties", {})
+        for branch in propertySchema.get("anyOf", [])
+    )
+
+
+timeCurveProperties = [name for name, p in emitterProperties.items() if isTimeCurve(p)]
+
+
+def propertyKind(propertySchema):
+    # "curve", a JSON type name, a list of allowed strings, or None for
+    # properties the schema does not constrain.
+    if isTimeCurve(propertySchema):
+        return "curve"
+    if "oneOf" in propertySchema:
+        return [branch["const"] for branch in propertySchema["oneOf"]]
+    return propertySchema.get("type")
+
+
+propertyKinds = {name: propertyKind(p) for name, p in emitterProperties.items()}
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+import argparse
+import hashlib
+import json
+import sys
+from array import array
+from collections import Counter
+
+from pfx_emitter import emitterDefaults, emitterValue, normalizeBursts, timeCurveProperties
+from pfx_model import Emitter, PackedCurve, ParticleSystem
+
+
+timeCurves = frozenset(timeCurveProperties)
+
+
+def number(value):
+    # Adding 0.0 folds -0.0 into 0.0 so equal curves hash equally.
+    return float(value) + 0.0
+
+
+def isNumber(value):
+    return type(value) in (int, float)
+
+
+def isKeys(value):
+    return isinstance(value, list) and all(
+        isinstance(key, list) and len(key) == 2 and isNumber(key[0]) and isNumber(key[1]) for key in value
+    )
+
+
+def canonicalCurve(value, default):
+    # One spelling per curve that timeCurve() accepts: a float for anything
+    # constant, otherwise {"keys": ..., "stepped": ...} with keys in time
+    # order. Values the schema would reject are left alone.
+    if isNumber(value):
+        return number(value)
+    stepped = False
+    if isinstance(value, dict) and set(value) <= {"keys", "stepped"} and type(value.get("stepped", False)) is bool:
+        stepped = value.get("stepped", False)
+        value = value.get("keys", [])
+    if not isKeys(value):
+        return value
+    if not value:
+        return number(default)
+    keys = sorted(([number(t), number(v)] for t, v in value), key=lambda key: key[0])
+    if all(key[1] == keys[0][1] for key in keys):
+        return keys[0][1]
+    return {"keys": keys, "stepped": stepped}
+
+
+def isBursts(value):
+    if type(value) is int:
+        return True
+    if not isinstance(value, list):
+        return False
+    for burst in value:
+        if isinstance(burst, list):
+            if not 2 <= len(burst) <= 4 or not all(isNumber(x) for x in burst):
+                return False
+        elif isinstance(burst, dict):
+            if not all(isNumber(burst.get(key, 0)) for key in ("time", "count", "countRange", "chance")):
+                return False
+        else:
+            return False
+    return True
+
+
+def canonicalBursts(value):
+    # Every bursts() form becomes a time-sorted list of
+    # [time, count, countRange, chance].
+    if not isBursts(value):
+        return value
+    return [[number(x) for x in burst] for burst in normalizeBursts(value).tolist()]
+
+
+def canonicalValue(name, value):
+    if name in timeCurves:
+        return canonicalCurve(value, emitterDefaults[name])
+    if name == "emissionBursts":
+        return canonicalBursts(value)
+    return value
+
+
+def canonicalEmitter(emitter):
+    # The effective value of every property that differs from its schema
+    # default, so {} and {"sizeX": 1} and {"sizeX": [[0, 1]]} all agree.
+    if not isinstance(emitter, dict):
+        return emitter
+    canonical = {}
+    for name in emitterDefaults:
+        if name == "emissionRate":
+            continue
+        value = canonicalValue(name, emitterValue(emitter, name))
+        default = canonicalValue(name, emitterDefaults[name])
+        if type(value) is not type(default) or value != default:
+            canonical[name] = value
+    # emissionRate defaults to 0 next to bursts, so it is compared with the
+    # default the canonical emitter would read.
+    value = canonicalValue("emissionRate", emitterValue(emitter, "emissionRate"))
+    default = canonicalValue("emissionRate", emitterValue(canonical, "emissionRate"))
+    if type(value) is not type(default) or value != default:
+        canonical["emissionRate"] = value
+    for name, value in emitter.items():
+        if name not in emitterDefaults:
+            canonical[name] = value
+    return canonical
+
+
+def contentHash(value):
+    data = json.dumps(value, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(data).hexdigest()[:16], len(data)
+
+
+class InternPool:
+    # Content-addressed pools of curves and emitters. Interned emitters
+    # store their curves as {"$curve": hash}. Pooled models are shared
+    # between every effect that uses them and must be treated as read-only.
+    def __init__(self):
+        self.curves = {}
+        self.emitters = {}
+        self.curveUses = Counter()
+        self.emitterUses = Counter()
+        self.curveNames = {}
+        self.rawBytes = 0
+        self.curveModels = {}
+        self.emitterModels = {}
+
+    def internCurve(self, name, curve):
+        key, size = contentHash(curve)
+        self.curves.setdefault(key, curve)
+        self.curveUses[key] += 1
+        self.curveNames.setdefault(key, Counter())[name] += 1
+        self.rawBytes += size
+        return {"$curve": key}
+
+    def internEmitter(self, emitter):
+        canonical = canonicalEmitter(emitter)
+        if isinstance(canonical, dict):
+            canonical = {
+                name: self.internCurve(name, value) if name in timeCurves and isinstance(value, dict) and "keys" in value else value
+                for name, value in canonical.items()
+            }
+        key, size = contentHash(canonical)
+        self.emitters.setdefault(key, canonical)
+        self.emitterUses[key] += 1
+        self.rawBytes += size
+        return key
+
+    def internSystem(self, system):
+        if not isinstance(system, dict) or not isinstance(system.get("emitters"), list):
+            return system
+        return dict(system, emitters=[self.internEmitter(emitter) for emitter in system["emitters"]])
+
+    def curveModel(self, key):
+        model = self.curveModels.get(key)
+        if model is None:
+            curve = self.curves[key]
+            keys = array("d", [x for key in curve["keys"] for x in key])
+            model = self.curveModels[key] = PackedCurve(keys, curve["stepped"])
+        return model
+
+    def emitterModel(self, key):
+        model = self.emitterModels.get(key)
+        if model is None:
+            data = self.emitters[key]
+            if not isinstance(data, dict):
+                return data
+            model = Emitter()
+            for name, value in data.items():
+                if isinstance(value, dict) and "$curve" in value:
+                    value = self.curveModel(value["$curve"])
+                if name in Emitter.defaults:
+                    setattr(model, name, value)
+                else:
+                    if model.extra is None:
+                        model.extra = {}
+                    model.extra[name] = value
+            self.emitterModels[key] = model
+        return model
+
+    def loadSystem(self, interned):
+        # A ParticleSystem whose emitters and curves come from the pool.
+        system = ParticleSystem()
+        for name, value in interned.items():
+            if name == "emitters" and isinstance(value, list):
+                value = [self.emitterModel(key) for key in value]
+            if name in ParticleSystem.defaults:
+                setattr(system, name, value)
+            else:
+                if system.extra is None:
+                    system.extra = {}
+                system.extra[name] = value
+        return system
+
+    def stats(self, top=10):
+        curveBytes = sum(contentHash(curve)[1] for curve in self.curves.values())
+        emitterBytes = sum(contentHash(emitter)[1] for emitter in self.emitters.values())
+        return {
+            "curves": sum(self.curveUses.values()),
+            "uniqueCurves": len(self.curves),
+            "emitters": sum(self.emitterUses.values()),
+            "uniqueEmitters": len(self.emitters),
+            "canonicalBytes": self.rawBytes,
+            "pooledBytes": curveBytes + emitterBytes,
+            "topCurves": [
+                {"hash": key, "uses": uses, "properties": dict(self.curveNames[key].most_common(3)), "keys": len(self.curves[key]["keys"])}
+                for key, uses in self.curveUses.most_common(top) if uses > 1
+            ],
+        }
+
+    def toJson(self, systems):
+        return {"curves": self.curves, "emitters": self.emitters, "systems": systems}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find and pool identical curves and emitters across .pfx files.")
+    parser.add_argument("paths", nargs="+", help=".pfx files to intern")
+    parser.add_argument("--pack", metavar="JSON", help="write the pooled library to this file")
+    parser.add_argument("--top", type=int, default=10, help="number of most shared curves to list")
+    args = parser.parse_args()
+
+    pool = InternPool()
+    systems = {}
+    for path in args.paths:
+        with open(path, encoding="utf-8-sig") as f:
+            systems[path] = pool.internSystem(json.load(f))
+
+    if args.pack:
+        with open(args.pack, "w") as f:
+            json.dump(pool.toJson(systems), f, separators=(",", ":"))
+
+    json.dump(pool.stats(args.top), sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
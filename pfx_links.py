@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import sys
+
+import pfx_cost
+from pfx_emitter import emitterValue
+
+
+def linkTarget(emitter):
+    # The emitter an EMITTER-type emitter is attached to, or None.
+    if not isinstance(emitter, dict) or emitterValue(emitter, "type") != "EMITTER":
+        return None
+    link = emitterValue(emitter, "linkIndex")
+    if type(link) is float and link.is_integer():
+        link = int(link)
+    return link
+
+
+def compileLinks(emitters):
+    # Builds the parent links of one system and a parent-first update
+    # order. Emitters that are not objects, and emitters on or under a
+    # cycle or a bad link, get no depth and are left out of the order.
+    count = len(emitters)
+    parents = [-1] * count
+    errors = []
+    warnings = []
+
+    for i, emitter in enumerate(emitters):
+        link = linkTarget(emitter)
+        if link is None:
+            if isinstance(emitter, dict) and emitterValue(emitter, "linkIndex") != -1:
+                warnings.append({"emitter": i, "message": "linkIndex is ignored unless type is EMITTER"})
+            continue
+        if type(link) is not int or not 0 <= link < count:
+            errors.append({"emitter": i, "message": "linkIndex %r is not an emitter index (0..%d)" % (link, count - 1)})
+            parents[i] = None
+        elif not isinstance(emitters[link], dict):
+            errors.append({"emitter": i, "message": "linked emitter %d is not an object" % link})
+            parents[i] = None
+        else:
+            parents[i] = link
+
+    depths = [None] * count
+    broken = [not isinstance(emitter, dict) for emitter in emitters]
+    for i in range(count):
+        # Walk up the parents until a root, an emitter already placed, a bad
+        # link, or an emitter already on this walk, which is a cycle.
+        path = []
+        node = i
+        while node is not None and node >= 0 and depths[node] is None and not broken[node] and node not in path:
+            path.append(node)
+            node = parents[node]
+        if node in path:
+            cycle = path[path.index(node):] + [node]
+            errors.append({"emitter": node, "message": "link cycle through emitters %s" % " -> ".join(map(str, cycle))})
+        if node is None or node in path or node >= 0 and broken[node]:
+            for n in path:
+                broken[n] = True
+            continue
+        depth = depths[node] if node >= 0 else -1
+        for n in reversed(path):
+            depth += 1
+            depths[n] = depth
+
+    order = sorted((i for i in range(count) if depths[i] is not None), key=lambda i: (depths[i], i))
+    levels = []
+    for i in order:
+        if depths[i] == len(levels):
+            levels.append([])
+        levels[depths[i]].append(i)
+
+    return {
+        "parents": parents,
+        "depths": depths,
+        "order": order,
+        "levels": levels,
+        "errors": errors,
+        "warnings": warnings,
+    }
+
+
+def chainPeaks(emitters, links):
+    # Worst-case live particles per emitter once every parent particle runs
+    # its own copy of a linked emitter. A set maxParticles still caps the
+    # emitter as a whole.
+    peaks = [None] * len(emitters)
+    multipliers = [None] * len(emitters)
+    for i in links["order"]:
+        cost = pfx_cost.emitterCost(emitters[i])
+        parent = links["parents"][i]
+        multipliers[i] = peaks[parent] if parent >= 0 else 1
+        peak = cost["smartMaxParticles"] * multipliers[i]
+        if cost["maxParticles"] is not None:
+            peak = min(peak, max(int(cost["maxParticles"]), 0))
+        peaks[i] = peak
+    return peaks, multipliers
+
+
+def systemLinks(system, budget=None):
+    emitters = system.get("emitters", []) if isinstance(system, dict) else []
+    if not isinstance(emitters, list):
+        emitters = []
+    links = compileLinks(emitters)
+    peaks, multipliers = chainPeaks(emitters, links)
+
+    failures = []
+    for i in links["order"]:
+        if budget is not None and peaks[i] > budget:
+            failures.append("emitter %d worst case of %d live particles exceeds budget %d" % (i, peaks[i], budget))
+
+    return {
+        "order": links["order"],
+        "levels": links["levels"],
+        "emitters": [
+            {"emitter": i, "parent": links["parents"][i], "depth": links["depths"][i], "multiplier": multipliers[i], "peakLive": peaks[i]}
+            for i in range(len(emitters))
+        ],
+        "peakLive": sum(peak for peak in peaks if peak is not None),
+        "errors": links["errors"],
+        "warnings": links["warnings"],
+        "budgetFailures": failures,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check EMITTER links in .pfx files and compute an update order and worst-case particle counts.")
+    parser.add_argument("paths", nargs="+", help=".pfx files to check")
+    parser.add_argument("--budget", type=int, help="fail if any emitter's worst-case live particle count exceeds this")
+    args = parser.parse_args()
+
+    report = {}
+    failed = False
+    for path in args.paths:
+        with open(path, encoding="utf-8-sig") as f:
+            result = systemLinks(json.load(f), args.budget)
+        report[path] = result
+        failed = failed or bool(result["errors"]) or bool(result["budgetFailures"])
+
+    json.dump(report, sys.stdout, indent=2)
+    print()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+import copy
+from array import array
+
+import numpy as np
+
+from gen_pfx import schema
+from pfx_curve import Curve
+from pfx_emitter import emitterDefaults, timeCurveProperties
+
+
+# Which members the {"keys": ..., "stepped": ...} form was written with.
+HAS_KEYS, HAS_STEPPED = 1, 2
+
+
+class PackedCurve:
+    # Curve keys stored flat as (t0, v0, t1, v1, ...) in one array of
+    # doubles. stepped is None for the [[t, v], ...] form and a bool for
+    # the {"keys": ..., "stepped": ...} form, whose members present are
+    # kept in fields so the curve is written back as it was read.
+    __slots__ = ("keys", "stepped", "fields")
+
+    def __init__(self, keys, stepped=None, fields=HAS_KEYS | HAS_STEPPED):
+        self.keys = keys
+        self.stepped = stepped
+        self.fields = fields
+
+    def __len__(self):
+        return len(self.keys) // 2
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, PackedCurve) and self.keys == other.keys
+            and self.stepped == other.stepped and self.fields == other.fields
+        )
+
+    def __hash__(self):
+        return hash((self.keys.tobytes(), self.stepped, self.fields))
+
+    def toCurve(self):
+        # A pfx_curve.Curve viewing the same memory.
+        keys = np.frombuffer(self.keys, dtype=np.float64).reshape(-1, 2)
+        return Curve(keys[:, 0], keys[:, 1], bool(self.stepped))
+
+    def toJson(self):
+        keys = self.keys.tolist()
+        keys = [keys[i:i + 2] for i in range(0, len(keys), 2)]
+        if self.stepped is None:
+            return keys
+        curve = {}
+        if self.fields & HAS_KEYS:
+            curve["keys"] = keys
+        if self.fields & HAS_STEPPED:
+            curve["stepped"] = self.stepped
+        return curve
+
+
+def isKeys(value):
+    return isinstance(value, list) and all(
+        isinstance(key, list) and len(key) == 2 and all(type(x) in (int, float) for x in key) for key in value
+    )
+
+
+def packCurve(value):
+    # Numbers stay numbers, key lists become PackedCurves, and anything the
+    # schema would reject is kept as is.
+    if isinstance(value, dict) and set(value) <= {"keys", "stepped"}:
+        keys = value.get("keys", [])
+        stepped = value.get("stepped", False)
+        if isKeys(keys) and type(stepped) is bool:
+            fields = (HAS_KEYS if "keys" in value else 0) | (HAS_STEPPED if "stepped" in value else 0)
+            return PackedCurve(array("d", [x for key in keys for x in key]), stepped, fields)
+    elif isKeys(value):
+        return PackedCurve(array("d", [x for key in value for x in key]))
+    return value
+
+
+class Model:
+    # Unset slots read as their schema default. Mutable defaults come back
+    # as a fresh copy that is not stored, so reading never changes a model;
+    # assign the edited value to keep it.
+    __slots__ = ("extra",)
+    defaults = {}
+
+    def __init__(self, **values):
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    def __getattr__(self, name):
+        defaults = type(self).defaults
+        if name == "extra":
+            return None
+        if name not in defaults:
+            raise AttributeError("%s has no property %r" % (type(self).__name__, name))
+        value = self.defaultFor(name)
+        if isinstance(value, (dict, list)):
+            value = copy.deepcopy(value)
+        return value
+
+    def defaultFor(self, name):
+        return type(self).defaults[name]
+
+    def isSet(self, name):
+        try:
+            object.__getattribute__(self, name)
+        except AttributeError:
+            return False
+        return True
+
+    def setNames(self):
+        return [name for name in type(self).defaults if self.isSet(name)]
+
+    def toJson(self):
+        data = {}
+        for name in self.setNames():
+            value = getattr(self, name)
+            data[name] = value.toJson() if isinstance(value, PackedCurve) else value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+def modelClass(name, properties, base=Model):
+    defaults = {propertyName: p.get("default") for propertyName, p in properties.items()}
+    return type(name, (base,), {"__slots__": tuple(properties), "defaults": defaults})
+
+
+class EmitterBase(Model):
+    __slots__ = ()
+
+    def defaultFor(self, name):
+        if name == "emissionRate" and self.isSet("emissionBursts"):
+            return 0.0
+        return emitterDefaults[name]
+
+
+Emitter = modelClass("Emitter", schema["properties"]["emitters"]["items"]["properties"], EmitterBase)
+ParticleSystem = modelClass("ParticleSystem", schema["properties"])
+
+timeCurves = frozenset(timeCurveProperties)
+
+
+def loadModel(cls, data, convert):
+    model = cls()
+    for name, value in data.items():
+        if name in cls.defaults:
+            setattr(model, name, convert(name, value))
+        else:
+            if model.extra is None:
+                model.extra = {}
+            model.extra[name] = value
+    return model
+
+
+def loadEmitter(data):
+    if not isinstance(data, dict):
+        return data
+    return loadModel(Emitter, data, lambda name, value: packCurve(value) if name in timeCurves else value)
+
+
+def loadSystem(data):
+    # Builds a ParticleSystem straight from parsed .pfx JSON.
+    def convert(name, value):
+        if name == "emitters" and isinstance(value, list):
+            return [loadEmitter(emitter) for emitter in value]
+        return value
+    return loadModel(ParticleSystem, data, convert)
+
+
+def systemToJson(system):
+    data = system.toJson()
+    if isinstance(data.get("emitters"), list):
+        data["emitters"] = [e.toJson() if isinstance(e, Model) else e for e in data["emitters"]]
+    return data
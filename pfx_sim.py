@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import math
+
+import numpy as np
+
+from pfx_cost import emitterCost
+from pfx_curve import normalizeCurve, sampleCurve
+from pfx_emitter import emitterDefaults, emitterValue, loopTiming, normalizeBursts
+from pfx_links import chainPeaks, compileLinks
+
+
+curveProperties = [
+    "offsetX", "offsetY", "offsetZ", "offsetRangeX", "offsetRangeY", "offsetRangeZ",
+    "velocityX", "velocityY", "velocityZ", "velocityRangeX", "velocityRangeY", "velocityRangeZ",
+    "velocity", "velocityRange", "gravity", "accelX", "accelY", "accelZ", "drag",
+    "lifetime", "lifetimeRange", "emissionRate",
+]
+
+cylinderAxes = {"CYLINDER_X": 0, "CYLINDER_Y": 1, "CYLINDER_Z": 2}
+boxAxes = {"BOX_X": 0, "BOX_Y": 1, "BOX_Z": 2}
+
+
+def unitVectors(rng, n):
+    v = rng.standard_normal((n, 3))
+    length = np.linalg.norm(v, axis=1, keepdims=True)
+    length[length == 0] = 1.0
+    return v / length
+
+
+def normalized(v):
+    length = np.linalg.norm(v, axis=1, keepdims=True)
+    return np.divide(v, length, out=np.zeros_like(v), where=length > 0)
+
+
+class EmitterSim:
+    def __init__(self, emitter, seed=0, maxParticles=None, parentCapacity=0):
+        self.emitter = emitter
+        self.rng = np.random.default_rng(seed)
+        self.type = emitterValue(emitter, "type")
+        self.curves = {name: normalizeCurve(emitterValue(emitter, name), emitterDefaults[name]) for name in curveProperties}
+        self.bursts = normalizeBursts(emitterValue(emitter, "emissionBursts"))
+
+        self.offsetAllowNegZ = emitterValue(emitter, "offsetAllowNegZ")
+        self.useRadialVelocityDir = emitterValue(emitter, "useRadialVelocityDir")
+        self.useShapeVelocityDir = emitterValue(emitter, "useShapeVelocityDir")
+
+        self.startLoop, self.endLoop, self.passes = loopTiming(emitter)
+
+        # Emitter timing is kept per instance. A linked emitter has one
+        # instance per parent particle slot, each on its own timeline from
+        # that particle's spawn; any other emitter has a single instance.
+        instances = max(parentCapacity, 1) if self.type == "EMITTER" else 1
+        self.time = np.zeros(instances)
+        self.waiting = np.zeros(instances)
+        self.passIndex = np.zeros(instances, dtype=np.int64)
+        self.done = np.ones(instances, dtype=bool)
+        self.carry = np.zeros(instances)
+        self.parentSerial = np.full(instances, -1, dtype=np.int64)
+        if self.type != "EMITTER":
+            self.start(np.zeros(1, dtype=np.intp))
+
+        if maxParticles is None:
+            maxParticles = emitterValue(emitter, "maxParticles")
+        if maxParticles is None:
+            maxParticles = max(emitterCost(emitter)["smartMaxParticles"], 1)
+        self.capacity = max(int(maxParticles), 0)
+
+        # Particle state lives in fixed arrays. Dead slots sit on a stack of
+        # free indices and are reused by later spawns.
+        self.position = np.zeros((self.capacity, 3))
+        self.velocity = np.zeros((self.capacity, 3))
+        self.age = np.zeros(self.capacity)
+        self.life = np.zeros(self.capacity)
+        self.alive = np.zeros(self.capacity, dtype=bool)
+        self.owner = np.zeros(self.capacity, dtype=np.intp)
+        self.serial = np.full(self.capacity, -1, dtype=np.int64)
+        self.free = np.arange(self.capacity - 1, -1, -1, dtype=np.intp)
+        self.freeCount = self.capacity
+        self.spawned = 0
+        self.dropped = 0
+
+    @property
+    def liveCount(self):
+        return self.capacity - self.freeCount
+
+    def livePositions(self):
+        return self.position[self.alive]
+
+    def finished(self):
+        return bool(self.done.all()) and self.liveCount == 0
+
+    def start(self, instances):
+        delay = emitterValue(self.emitter, "delay") + self.rng.uniform(-1, 1, len(instances)) * emitterValue(self.emitter, "delayRange")
+        self.waiting[instances] = np.maximum(delay, 0.0)
+        self.time[instances] = 0.0
+        self.passIndex[instances] = 0
+        self.done[instances] = False
+        self.carry[instances] = 0.0
+
+    def attach(self, parent, dt):
+        # Starts an instance for every parent particle spawned since the last
+        # step and stops those whose particle died. Returns the live
+        # instances and how much of this step each of them ran for.
+        self.done[~parent.alive] = True
+        live = np.flatnonzero(parent.alive)
+        fresh = self.parentSerial[live] != parent.serial[live]
+        self.parentSerial[live[fresh]] = parent.serial[live[fresh]]
+        self.start(live[fresh])
+        budget = np.full(len(live), float(dt))
+        budget[fresh] = np.minimum(dt, parent.age[live[fresh]])
+        return live, budget
+
+    def sample(self, name, t):
+        return sampleCurve(self.curves[name], t)
+
+    def spawnPositions(self, t, origin):
+        n = len(t)
+        rng = self.rng
+        offset = np.stack([self.sample("offsetX", t), self.sample("offsetY", t), self.sample("offsetZ", t)], axis=1)
+        extent = np.stack([self.sample("offsetRangeX", t), self.sample("offsetRangeY", t), self.sample("offsetRangeZ", t)], axis=1)
+
+        if self.type == "SPHEROID":
+            shape = unitVectors(rng, n) * rng.random((n, 1)) ** (1 / 3) * extent
+            position = offset + shape
+        elif self.type == "SHELL":
+            shape = unitVectors(rng, n) * extent
+            position = offset + shape
+        elif self.type in cylinderAxes or self.type in boxAxes:
+            a = cylinderAxes.get(self.type, boxAxes.get(self.type))
+            b, c = [axis for axis in range(3) if axis != a]
+            # The other two offset axes give the cross-section size and their
+            # ranges give its thickness.
+            radius = offset + rng.uniform(-1, 1, (n, 3)) * extent
+            shape = np.zeros((n, 3))
+            if self.type in cylinderAxes:
+                theta = rng.uniform(0, 2 * math.pi, n)
+                shape[:, b] = np.cos(theta) * radius[:, b]
+                shape[:, c] = np.sin(theta) * radius[:, c]
+            else:
+                side = rng.integers(0, 4, n)
+                along = rng.uniform(-1, 1, n)
+                sign = np.where(side % 2 == 0, 1.0, -1.0)
+                onB = side < 2
+                shape[:, b] = np.where(onB, sign * radius[:, b], along * offset[:, b])
+                shape[:, c] = np.where(onB, along * offset[:, c], sign * radius[:, c])
+            position = shape.copy()
+            position[:, a] = radius[:, a]
+        else:
+            # POSITION, plus EMITTER around a parent particle. MESH has no mesh
+            # to sample here and falls back to the box.
+            shape = rng.uniform(-1, 1, (n, 3)) * extent
+            position = offset + shape
+
+        if origin is not None:
+            position += origin
+
+        if not self.offsetAllowNegZ:
+            position[:, 2] = np.abs(position[:, 2])
+        return position, shape
+
+    def spawn(self, t, age, owner, origins=None):
+        # age is how far into the current step each particle was spawned,
+        # so it expires on time rather than up to one step late. owner is
+        # the spawning instance, and origins the parent particle positions
+        # of a linked emitter.
+        n = min(len(t), self.freeCount)
+        self.dropped += len(t) - n
+        if n == 0:
+            return
+        t = t[:n]
+        age = age[:n]
+        owner = owner[:n]
+        rng = self.rng
+
+        position, shape = self.spawnPositions(t, origins[owner] if origins is not None else None)
+
+        direction = np.stack([
+            self.sample("velocityX", t) + rng.uniform(-1, 1, n) * self.sample("velocityRangeX", t),
+            self.sample("velocityY", t) + rng.uniform(-1, 1, n) * self.sample("velocityRangeY", t),
+            self.sample("velocityZ", t) + rng.uniform(-1, 1, n) * self.sample("velocityRangeZ", t),
+        ], axis=1)
+        if self.useRadialVelocityDir:
+            direction += normalized(position)
+        if self.useShapeVelocityDir:
+            direction += normalized(shape)
+        speed = self.sample("velocity", t) + rng.uniform(-1, 1, n) * self.sample("velocityRange", t)
+        lifetime = self.sample("lifetime", t) + rng.uniform(-1, 1, n) * self.sample("lifetimeRange", t)
+
+        slots = self.free[self.freeCount - n:self.freeCount]
+        self.freeCount -= n
+        self.position[slots] = position
+        self.velocity[slots] = normalized(direction) * speed[:, None]
+        self.age[slots] = age
+        self.life[slots] = lifetime
+        self.alive[slots] = True
+        self.owner[slots] = owner
+        self.serial[slots] = np.arange(self.spawned, self.spawned + n)
+        self.spawned += n
+
+    def emitSegment(self, instances, t0, t1, end, origins):
+        # Spawns what each instance emits between its own times t0 and t1.
+        # end is the instance time at the end of this step.
+        rate = np.maximum(self.sample("emissionRate", 0.5 * (t0 + t1)), 0.0)
+        carry = self.carry[instances] + rate * (t1 - t0)
+        counts = carry.astype(np.int64)
+        self.carry[instances] = carry - counts
+        owner = np.repeat(np.arange(len(instances)), counts)
+        k = np.arange(len(owner)) - np.repeat(np.cumsum(counts) - counts, counts)
+        owners = [owner]
+        times = [t0[owner] + (k + 0.5) * ((t1 - t0) / np.maximum(counts, 1))[owner]]
+
+        first = np.searchsorted(self.bursts[:, 0], t0.min(), side="left")
+        last = np.searchsorted(self.bursts[:, 0], t1.max(), side="left")
+        for time, burstCount, countRange, chance in self.bursts[first:last]:
+            fired = np.flatnonzero((t0 <= time) & (time < t1))
+            fired = fired[self.rng.random(len(fired)) < chance]
+            if len(fired) == 0:
+                continue
+            spread = self.rng.integers(-abs(int(countRange)), abs(int(countRange)) + 1, len(fired))
+            n = np.maximum(int(burstCount) + spread, 0)
+            owners.append(np.repeat(fired, n))
+            times.append(np.full(int(n.sum()), time))
+
+        owner = np.concatenate(owners)
+        times = np.concatenate(times)
+        self.spawn(times, end[owner] - times, instances[owner], origins)
+
+    def advance(self, dt, instances, origins=None):
+        # dt is how long each instance runs this step. Instances that wrap
+        # a loop go round again until they reach their end time.
+        waiting = self.waiting[instances]
+        used = np.minimum(dt, waiting)
+        self.waiting[instances] = waiting - used
+        dt = dt - used
+        running = (dt > 0) & ~self.done[instances]
+        instances = instances[running]
+        end = self.time[instances] + dt[running]
+        while len(instances):
+            t1 = np.minimum(end, self.endLoop)
+            self.emitSegment(instances, self.time[instances], t1, end, origins)
+            self.time[instances] = t1
+            wrapped = end >= self.endLoop
+            instances, end = instances[wrapped], end[wrapped]
+            self.passIndex[instances] += 1
+            more = self.passIndex[instances] < self.passes
+            self.done[instances[~more]] = True
+            instances, end = instances[more], end[more] - (self.endLoop - self.startLoop)
+            self.time[instances] = self.startLoop
+            self.carry[instances] = 0.0
+
+    def step(self, dt, parent=None):
+        # Forces are sampled at the time of the instance that spawned each
+        # particle and applied to every slot at once. Dead slots are updated
+        # too, which is cheaper than gathering the live ones.
+        t = self.time[0] if len(self.time) == 1 else self.time[self.owner]
+        accel = np.stack([
+            self.sample("accelX", t),
+            self.sample("accelY", t),
+            self.sample("accelZ", t) + self.sample("gravity", t),
+        ], axis=-1)
+        drag = self.sample("drag", t)
+
+        # A drag of 0.0 means no drag. A negative multiplier has no
+        # fractional power, so negative drag acts as a real drag of 0.0 and
+        # stops the particles.
+        self.velocity += accel * dt
+        self.velocity *= np.where(drag == 0.0, 1.0, np.maximum(drag, 0.0) ** dt)[..., None]
+        self.position += self.velocity * dt
+        self.age += dt
+
+        expired = np.flatnonzero(self.alive & (self.age >= self.life))
+        if len(expired):
+            self.alive[expired] = False
+            self.free[self.freeCount:self.freeCount + len(expired)] = expired
+            self.freeCount += len(expired)
+
+        if self.type != "EMITTER":
+            self.advance(np.full(1, float(dt)), np.zeros(1, dtype=np.intp))
+        elif parent is not None:
+            instances, budget = self.attach(parent, dt)
+            self.advance(budget, instances, parent.position)
+
+
+class SystemSim:
+    def __init__(self, system, seed=0):
+        emitters = system.get("emitters", [])
+        for i, emitter in enumerate(emitters):
+            if not isinstance(emitter, dict):
+                raise ValueError("emitter %d is not an object" % i)
+        links = compileLinks(emitters)
+        if links["errors"]:
+            raise ValueError("; ".join("emitter %d: %s" % (error["emitter"], error["message"]) for error in links["errors"]))
+
+        # Linked emitters are sized for every copy their parents can run.
+        peaks = chainPeaks(emitters, links)[0]
+        self.parents = links["parents"]
+        self.order = links["order"]
+        self.emitters = [None] * len(emitters)
+        for i in self.order:
+            parent = self.parents[i]
+            self.emitters[i] = EmitterSim(
+                emitters[i], seed + i,
+                max(peaks[i], 1) if emitterValue(emitters[i], "maxParticles") is None else None,
+                self.emitters[parent].capacity if parent >= 0 else 0,
+            )
+
+    def step(self, dt):
+        # Parents update before their children, so children spawn from this
+        # step's parent particles.
+        for i in self.order:
+            parent = self.parents[i]
+            self.emitters[i].step(dt, self.emitters[parent] if parent >= 0 else None)
+
+    def finished(self):
+        return all(emitter.finished() for emitter in self.emitters)
+
+    def run(self, duration, dt=1 / 60):
+        # Returns the live particle count of every emitter at every step.
+        steps = int(math.ceil(duration / dt))
+        counts = np.zeros((steps, len(self.emitters)), dtype=np.int64)
+        for frame in range(steps):
+            self.step(dt)
+            counts[frame] = [emitter.liveCount for emitter in self.emitters]
+        return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate a .pfx particle system without the game.")
+    parser.add_argument("path", help=".pfx file to simulate")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds to simulate")
+    parser.add_argument("--fps", type=float, default=60.0, help="simulation steps per second")
+    parser.add_argument("--seed", type=int, default=0, help="random seed, for reproducible runs")
+    args = parser.parse_args()
+
+    with open(args.path, encoding="utf-8-sig") as f:
+        system = json.load(f)
+
+    sim = SystemSim(system, args.seed)
+    counts = sim.run(args.duration, 1 / args.fps)
+    report = []
+    for i, emitter in enumerate(sim.emitters):
+        report.append({
+            "emitter": i,
+            "capacity": emitter.capacity,
+            "spawned": emitter.spawned,
+            "dropped": emitter.dropped,
+            "peakLive": int(counts[:, i].max()) if len(counts) else 0,
+            "finalLive": emitter.liveCount,
+        })
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import sys
+
+from pfx_curve import simplifyKeys
+from pfx_emitter import timeCurveProperties
+
+
+def simplifyCurve(value, tolerance):
+    # Returns the simplified value in the same form it came in, or a scalar
+    # when the curve never strays more than `tolerance` from a constant.
+    if isinstance(value, dict):
+        keys = value.get("keys")
+        stepped = value.get("stepped", False)
+    else:
+        keys = value
+        stepped = False
+    if not isinstance(keys, list) or not keys:
+        return value
+
+    times = [key[0] for key in keys]
+    values = [key[1] for key in keys]
+    if times != sorted(times):
+        return value
+
+    low, high = min(values), max(values)
+    if low == high:
+        return values[0]
+    if high - low <= 2 * tolerance:
+        return (low + high) / 2
+
+    keys = [keys[i] for i in simplifyKeys(times, values, stepped, tolerance)]
+    if isinstance(value, dict):
+        return dict(value, keys=keys)
+    return keys
+
+
+def keyCount(value):
+    if isinstance(value, dict):
+        value = value.get("keys", [])
+    return len(value) if isinstance(value, list) else 0
+
+
+def simplifySystem(system, tolerance):
+    # Rewrites the curves in place and returns one row per curve property.
+    rows = []
+    for i, emitter in enumerate(system.get("emitters", [])):
+        for name in timeCurveProperties:
+            if name not in emitter:
+                continue
+            before = keyCount(emitter[name])
+            if before == 0:
+                continue
+            emitter[name] = simplifyCurve(emitter[name], tolerance)
+            rows.append({"emitter": i, "property": name, "before": before, "after": keyCount(emitter[name])})
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drop time curve keyframes from .pfx files within an error tolerance.")
+    parser.add_argument("paths", nargs="+", help=".pfx files to simplify")
+    parser.add_argument("-t", "--tolerance", type=float, default=0.001, help="largest allowed change of a curve value")
+    parser.add_argument("-o", "--output", help="directory to write simplified files to, instead of rewriting them in place")
+    parser.add_argument("-n", "--dry-run", action="store_true", help="only report key counts")
+    args = parser.parse_args()
+
+    before = after = 0
+    for path in args.paths:
+        with open(path, encoding="utf-8-sig") as f:
+            system = json.load(f)
+        rows = simplifySystem(system, args.tolerance)
+        for row in rows:
+            result = "%d keys" % row["after"] if row["after"] else "constant"
+            print("%s: emitters/%d/%s %d keys -> %s" % (path, row["emitter"], row["property"], row["before"], result))
+            before += row["before"]
+            after += row["after"]
+        if args.dry_run or not any(row["before"] != row["after"] for row in rows):
+            continue
+        target = path
+        if args.output:
+            os.makedirs(args.output, exist_ok=True)
+            target = os.path.join(args.output, os.path.basename(path))
+        with open(target, "w") as f:
+            json.dump(system, f, indent=2)
+
+    print("%d keys -> %d keys" % (before, after), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
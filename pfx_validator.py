@@ -0,0 +1,2344 @@
+# Generated by gen_pfx.py from the particle system schema. Do not edit.
+
+
+def check_spec(v):
+    return True
+
+
+def check_type(v):
+    if type(v) is not str or v not in {'POSITION', 'SPHEROID', 'SHELL', 'EMITTER', 'CYLINDER_X', 'CYLINDER_Y', 'CYLINDER_Z', 'BOX_X', 'BOX_Y', 'BOX_Z', 'MESH'}:
+        return False
+    return True
+
+
+def check_linkIndex(v):
+    t0 = type(v)
+    if not (t0 is int or t0 is float and v.is_integer()):
+        return False
+    return True
+
+
+def check_offsetX(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_offsetY(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_offsetZ(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_offsetRangeX(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_offsetRangeY(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_offsetRangeZ(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_offsetAllowNegZ(v):
+    t0 = type(v)
+    if not (t0 is bool):
+        return False
+    return True
+
+
+def check_velocityX(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_velocityY(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_velocityZ(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_velocityRangeX(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_velocityRangeY(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_velocityRangeZ(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_useRadialVelocityDir(v):
+    t0 = type(v)
+    if not (t0 is bool):
+        return False
+    return True
+
+
+def check_useShapeVelocityDir(v):
+    t0 = type(v)
+    if not (t0 is bool):
+        return False
+    return True
+
+
+def check_velocity(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_velocityRange(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_inheritedVelocity(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_gravity(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_accelX(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_accelY(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_accelZ(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_drag(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_sizeX(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_sizeY(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_sizeRangeX(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_sizeRangeY(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_sizeRangeFlip(v):
+    t0 = type(v)
+    if not (t0 is bool):
+        return False
+    return True
+
+
+def check_sizeRangeFlipX(v):
+    t0 = type(v)
+    if not (t0 is bool):
+        return False
+    return True
+
+
+def check_sizeRangeFlipY(v):
+    t0 = type(v)
+    if not (t0 is bool):
+        return False
+    return True
+
+
+def check_sizeSquareAspect(v):
+    t0 = type(v)
+    if not (t0 is bool):
+        return False
+    return True
+
+
+def check_sizeConstantAspect(v):
+    t0 = type(v)
+    if not (t0 is bool):
+        return False
+    return True
+
+
+def check_rotation(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_rotationRange(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_rotationRate(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_rotationRateRange(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_snapToSurface(v):
+    t0 = type(v)
+    if not (t0 is bool):
+        return False
+    return True
+
+
+def check_snapToSurfaceOffset(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_red(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_green(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_blue(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_alpha(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_rgb(v):
+    return True
+
+
+def check_useArmyColor(v):
+    t0 = type(v)
+    if not (t0 is int or t0 is float and v.is_integer()):
+        return False
+    return True
+
+
+def check_rampV(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_rampRangeV(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_rampOffsetV(v):
+    t0 = type(v)
+    if not (t0 is bool):
+        return False
+    return True
+
+
+def check_lifetime(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_lifetimeRange(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_emitterLifetime(v):
+    t0 = type(v)
+    if not (t0 is int or t0 is float):
+        return False
+    return True
+
+
+def check_delay(v):
+    t0 = type(v)
+    if not (t0 is int or t0 is float):
+        return False
+    return True
+
+
+def check_delayRange(v):
+    t0 = type(v)
+    if not (t0 is int or t0 is float):
+        return False
+    return True
+
+
+def check_bLoop(v):
+    t0 = type(v)
+    if not (t0 is bool):
+        return False
+    return True
+
+
+def check_loopCount(v):
+    t0 = type(v)
+    if not (t0 is int or t0 is float and v.is_integer()):
+        return False
+    return True
+
+
+def check_startLoop(v):
+    t0 = type(v)
+    if not (t0 is int or t0 is float):
+        return False
+    return True
+
+
+def check_endLoop(v):
+    t0 = type(v)
+    if not (t0 is int or t0 is float):
+        return False
+    return True
+
+
+def check_startDistance(v):
+    t0 = type(v)
+    if not (t0 is int or t0 is float):
+        return False
+    return True
+
+
+def check_endDistance(v):
+    t0 = type(v)
+    if not (t0 is int or t0 is float):
+        return False
+    return True
+
+
+def check_useWorldSpace(v):
+    t0 = type(v)
+    if not (t0 is bool):
+        return False
+    return True
+
+
+def check_useArcLengthSpace(v):
+    t0 = type(v)
+    if not (t0 is bool):
+        return False
+    return True
+
+
+def check_interpolateSpawn(v):
+    t0 = type(v)
+    if not (t0 is bool):
+        return False
+    return True
+
+
+def check_killOnDeactivate(v):
+    t0 = type(v)
+    if not (t0 is bool):
+        return False
+    return True
+
+
+def check_emissionBursts(v):
+    t0 = type(v)
+    if t0 is int or t0 is float and v.is_integer():
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if t2 is list:
+                n3 = len(v2)
+                if n3 < 2 or n3 > 4:
+                    return False
+                v4 = v2[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v2[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float and v4.is_integer()):
+                    return False
+                if n3 > 2:
+                    v4 = v2[2]
+                    t4 = type(v4)
+                    if not (t4 is int or t4 is float and v4.is_integer()):
+                        return False
+                if n3 > 3:
+                    v4 = v2[3]
+                    t4 = type(v4)
+                    if not (t4 is int or t4 is float):
+                        return False
+            elif t2 is dict:
+                if 'time' in v2:
+                    v4 = v2['time']
+                    t4 = type(v4)
+                    if not (t4 is int or t4 is float):
+                        return False
+                if 'count' in v2:
+                    v4 = v2['count']
+                    t4 = type(v4)
+                    if not (t4 is int or t4 is float and v4.is_integer()):
+                        return False
+                if 'countRange' in v2:
+                    v4 = v2['countRange']
+                    t4 = type(v4)
+                    if not (t4 is int or t4 is float and v4.is_integer()):
+                        return False
+                if 'chance' in v2:
+                    v4 = v2['chance']
+                    t4 = type(v4)
+                    if not (t4 is int or t4 is float):
+                        return False
+            else:
+                return False
+    else:
+        return False
+    return True
+
+
+def check_emissionRate(v):
+    t0 = type(v)
+    if t0 is int or t0 is float:
+        pass
+    elif t0 is list:
+        for v2 in v:
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            n2 = len(v2)
+            if n2 < 2 or n2 > 2:
+                return False
+            v3 = v2[0]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+            v3 = v2[1]
+            t3 = type(v3)
+            if not (t3 is int or t3 is float):
+                return False
+    elif t0 is dict:
+        if 'keys' in v:
+            v2 = v['keys']
+            t2 = type(v2)
+            if not (t2 is list):
+                return False
+            for v3 in v2:
+                t3 = type(v3)
+                if not (t3 is list):
+                    return False
+                n3 = len(v3)
+                if n3 < 2 or n3 > 2:
+                    return False
+                v4 = v3[0]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+                v4 = v3[1]
+                t4 = type(v4)
+                if not (t4 is int or t4 is float):
+                    return False
+        if 'stepped' in v:
+            v2 = v['stepped']
+            t2 = type(v2)
+            if not (t2 is bool):
+                return False
+    else:
+        return False
+    return True
+
+
+def check_maxParticles(v):
+    t0 = type(v)
+    if not (t0 is int or t0 is float):
+        return False
+    return True
+
+
+EMITTER_CHECKS = {
+    'spec': check_spec,
+    'type': check_type,
+    'linkIndex': check_linkIndex,
+    'offsetX': check_offsetX,
+    'offsetY': check_offsetY,
+    'offsetZ': check_offsetZ,
+    'offsetRangeX': check_offsetRangeX,
+    'offsetRangeY': check_offsetRangeY,
+    'offsetRangeZ': check_offsetRangeZ,
+    'offsetAllowNegZ': check_offsetAllowNegZ,
+    'velocityX': check_velocityX,
+    'velocityY': check_velocityY,
+    'velocityZ': check_velocityZ,
+    'velocityRangeX': check_velocityRangeX,
+    'velocityRangeY': check_velocityRangeY,
+    'velocityRangeZ': check_velocityRangeZ,
+    'useRadialVelocityDir': check_useRadialVelocityDir,
+    'useShapeVelocityDir': check_useShapeVelocityDir,
+    'velocity': check_velocity,
+    'velocityRange': check_velocityRange,
+    'inheritedVelocity': check_inheritedVelocity,
+    'gravity': check_gravity,
+    'accelX': check_accelX,
+    'accelY': check_accelY,
+    'accelZ': check_accelZ,
+    'drag': check_drag,
+    'sizeX': check_sizeX,
+    'sizeY': check_sizeY,
+    'sizeRangeX': check_sizeRangeX,
+    'sizeRangeY': check_sizeRangeY,
+    'sizeRangeFlip': check_sizeRangeFlip,
+    'sizeRangeFlipX': check_sizeRangeFlipX,
+    'sizeRangeFlipY': check_sizeRangeFlipY,
+    'sizeSquareAspect': check_sizeSquareAspect,
+    'sizeConstantAspect': check_sizeConstantAspect,
+    'rotation': check_rotation,
+    'rotationRange': check_rotationRange,
+    'rotationRate': check_rotationRate,
+    'rotationRateRange': check_rotationRateRange,
+    'snapToSurface': check_snapToSurface,
+    'snapToSurfaceOffset': check_snapToSurfaceOffset,
+    'red': check_red,
+    'green': check_green,
+    'blue': check_blue,
+    'alpha': check_alpha,
+    'rgb': check_rgb,
+    'useArmyColor': check_useArmyColor,
+    'rampV': check_rampV,
+    'rampRangeV': check_rampRangeV,
+    'rampOffsetV': check_rampOffsetV,
+    'lifetime': check_lifetime,
+    'lifetimeRange': check_lifetimeRange,
+    'emitterLifetime': check_emitterLifetime,
+    'delay': check_delay,
+    'delayRange': check_delayRange,
+    'bLoop': check_bLoop,
+    'loopCount': check_loopCount,
+    'startLoop': check_startLoop,
+    'endLoop': check_endLoop,
+    'startDistance': check_startDistance,
+    'endDistance': check_endDistance,
+    'useWorldSpace': check_useWorldSpace,
+    'useArcLengthSpace': check_useArcLengthSpace,
+    'interpolateSpawn': check_interpolateSpawn,
+    'killOnDeactivate': check_killOnDeactivate,
+    'emissionBursts': check_emissionBursts,
+    'emissionRate': check_emissionRate,
+    'maxParticles': check_maxParticles,
+}
+
+
+def checkEmitter(v):
+    t0 = type(v)
+    if not (t0 is dict):
+        return False
+    for key, value in v.items():
+        check = EMITTER_CHECKS.get(key)
+        if check is not None and not check(value):
+            return False
+    return True
+
+
+def check_system_color(v):
+    t0 = type(v)
+    if not (t0 is list):
+        return False
+    n0 = len(v)
+    if n0 < 4 or n0 > 4:
+        return False
+    for v1 in v:
+        t1 = type(v1)
+        if not (t1 is int or t1 is float):
+            return False
+    return True
+
+
+def check_system_emitters(v):
+    t0 = type(v)
+    if not (t0 is list):
+        return False
+    for v1 in v:
+        if not checkEmitter(v1):
+            return False
+    return True
+
+
+SYSTEM_CHECKS = {
+    'color': check_system_color,
+    'emitters': check_system_emitters,
+}
+
+
+def isValid(v):
+    t0 = type(v)
+    if not (t0 is dict):
+        return False
+    for key, value in v.items():
+        check = SYSTEM_CHECKS.get(key)
+        if check is not None and not check(value):
+            return False
+    return True
+
+
+def escapePointer(key):
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def iterEmitterErrors(emitter, pointer):
+    if type(emitter) is not dict:
+        yield pointer, "emitter is not an object"
+        return
+    for key, value in emitter.items():
+        check = EMITTER_CHECKS.get(key)
+        if check is not None and not check(value):
+            yield "%s/%s" % (pointer, escapePointer(key)), "invalid value for %r" % key
+
+
+def iterErrors(system):
+    if type(system) is not dict:
+        yield "", "particle system is not an object"
+        return
+    for key, value in system.items():
+        if key == "emitters" and type(value) is list:
+            for i, emitter in enumerate(value):
+                yield from iterEmitterErrors(emitter, "/emitters/%d" % i)
+            continue
+        check = SYSTEM_CHECKS.get(key)
+        if check is not None and not check(value):
+            yield "/" + escapePointer(key), "invalid value for %r" % key
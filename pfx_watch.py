@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import sys
+import time
+
+from validate_pfx import findEffects
+
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+typeChecks = {
+    "number": lambda v: type(v) in (int, float),
+    "integer": lambda v: type(v) is int or type(v) is float and v.is_integer(),
+    "string": lambda v: type(v) is str,
+    "boolean": lambda v: type(v) is bool,
+    "array": lambda v: type(v) is list,
+    "object": lambda v: type(v) is dict,
+    "null": lambda v: v is None,
+}
+
+
+def escapePointer(key):
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def sameJson(a, b):
+    # Like ==, but 1, 1.0 and True differ, as they do to the schema.
+    if type(a) is not type(b):
+        return False
+    if type(a) is list:
+        return len(a) == len(b) and all(sameJson(x, y) for x, y in zip(a, b))
+    if type(a) is dict:
+        return a.keys() == b.keys() and all(sameJson(a[key], b[key]) for key in a)
+    return a == b
+
+
+def resolveRef(s, root):
+    # Local "#/..." references only, as written by gen_pfx.py --defs.
+    while isinstance(s, dict) and "$ref" in s:
+        target = root
+        for part in s["$ref"].lstrip("#/").split("/"):
+            if part:
+                target = target[part.replace("~1", "/").replace("~0", "~")]
+        s = target
+    return s
+
+
+def schemaErrors(s, value, pointer, root):
+    # Yields (pointer, message) for the draft-07 keywords pfx-schema uses,
+    # pointing at the deepest value that breaks a rule.
+    s = resolveRef(s, root)
+
+    if "type" in s and not typeChecks[s["type"]](value):
+        yield pointer, "expected %s" % s["type"]
+        return
+
+    if "const" in s and (type(value) is not type(s["const"]) or value != s["const"]):
+        yield pointer, "expected %r" % s["const"]
+    if "enum" in s and not any(type(value) is type(option) and value == option for option in s["enum"]):
+        yield pointer, "expected one of %s" % ", ".join(map(repr, s["enum"]))
+
+    if "oneOf" in s:
+        matched = [branch for branch in s["oneOf"] if not any(schemaErrors(branch, value, pointer, root))]
+        if len(matched) != 1:
+            options = [resolveRef(branch, root).get("const") for branch in s["oneOf"]]
+            if all(isinstance(option, str) for option in options):
+                yield pointer, "expected one of %s" % ", ".join(options)
+            else:
+                yield pointer, "expected exactly one matching schema, got %d" % len(matched)
+
+    if "anyOf" in s:
+        failures = []
+        for branch in s["anyOf"]:
+            errors = list(schemaErrors(branch, value, pointer, root))
+            if not errors:
+                failures = None
+                break
+            failures.append((resolveRef(branch, root), errors))
+        if failures is not None:
+            # Report the branch whose type fits, which is where the author
+            # went wrong, otherwise list the types that would be accepted.
+            fitting = [errors for branch, errors in failures if "type" not in branch or typeChecks[branch["type"]](value)]
+            if len(fitting) == 1:
+                yield from fitting[0]
+            else:
+                types = sorted({branch["type"] for branch, errors in failures if "type" in branch})
+                yield pointer, "expected %s" % " or ".join(types) if types else "no matching schema"
+
+    if type(value) is list:
+        if "minItems" in s and len(value) < s["minItems"]:
+            yield pointer, "expected at least %d items" % s["minItems"]
+        if "maxItems" in s and len(value) > s["maxItems"]:
+            yield pointer, "expected at most %d items" % s["maxItems"]
+        items = s.get("items")
+        if isinstance(items, list):
+            for i, (item, itemSchema) in enumerate(zip(value, items)):
+                yield from schemaErrors(itemSchema, item, "%s/%d" % (pointer, i), root)
+        elif items is not None:
+            for i, item in enumerate(value):
+                yield from schemaErrors(items, item, "%s/%d" % (pointer, i), root)
+
+    if type(value) is dict and "properties" in s:
+        for name, propertySchema in s["properties"].items():
+            if name in value:
+                yield from schemaErrors(propertySchema, value[name], "%s/%s" % (pointer, escapePointer(name)), root)
+
+
+class WatchValidator:
+    # Keeps the last parsed state of every file and the errors of every
+    # emitter property, so a save only re-checks properties that changed.
+    def __init__(self, schemaPath):
+        with open(schemaPath, encoding="utf-8-sig") as f:
+            self.schema = json.load(f)
+        self.emitterSchema = resolveRef(self.schema["properties"]["emitters"]["items"], self.schema)
+        self.emitterProperties = self.emitterSchema["properties"]
+        self.files = {}
+        self.checked = 0
+
+    def propertyErrors(self, name, value, pointer):
+        self.checked += 1
+        return list(schemaErrors(self.emitterProperties[name], value, pointer, self.schema))
+
+    def emitterErrors(self, emitter, previous):
+        # previous is the (emitter, {name: errors}) pair last seen at this
+        # index, if any. Errors are kept relative to the emitter.
+        if type(emitter) is not dict:
+            return emitter, {None: list(schemaErrors(self.emitterSchema, emitter, "", self.schema))}
+        oldEmitter, oldErrors = previous if previous and type(previous[0]) is dict else ({}, {})
+        errors = {}
+        for name, value in emitter.items():
+            if name not in self.emitterProperties:
+                continue
+            if name in oldEmitter and name in oldErrors and sameJson(oldEmitter[name], value):
+                errors[name] = oldErrors[name]
+            else:
+                errors[name] = self.propertyErrors(name, value, "/" + escapePointer(name))
+        return emitter, errors
+
+    def update(self, path):
+        # Re-parses one file and returns its full error list.
+        try:
+            with open(path, encoding="utf-8-sig") as f:
+                system = json.load(f)
+        except OSError as e:
+            self.files.pop(path, None)
+            return [("", str(e))]
+        except ValueError as e:
+            return [("", "invalid JSON: %s" % e)]
+
+        previous = self.files.get(path, {}).get("emitters", [])
+        errors = []
+        emitters = []
+        if type(system) is not dict:
+            errors += list(schemaErrors(self.schema, system, "", self.schema))
+        else:
+            for name, value in system.items():
+                if name == "emitters" and type(value) is list:
+                    continue
+                if name in self.schema.get("properties", {}):
+                    errors += schemaErrors(self.schema["properties"][name], value, "/" + escapePointer(name), self.schema)
+            if type(system.get("emitters")) is list:
+                for i, emitter in enumerate(system["emitters"]):
+                    state = self.emitterErrors(emitter, previous[i] if i < len(previous) else None)
+                    emitters.append(state)
+                    for propertyErrors in state[1].values():
+                        errors += [("/emitters/%d%s" % (i, pointer), message) for pointer, message in propertyErrors]
+
+        self.files[path] = {"emitters": emitters}
+        return errors
+
+    def forget(self, path):
+        self.files.pop(path, None)
+
+
+def snapshot(paths):
+    stats = {}
+    for path in findEffects(paths):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        stats[path] = (stat.st_mtime_ns, stat.st_size)
+    return stats
+
+
+def report(path, errors):
+    if not errors:
+        print("%s: ok" % path, flush=True)
+    for pointer, message in errors:
+        print("%s:%s: %s" % (path, pointer or "/", message), flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Watch .pfx files and re-validate what changes on every save.")
+    parser.add_argument("paths", nargs="+", help="files or directories to watch")
+    parser.add_argument("--schema", default=os.path.join(here, "pfx-schema"), help="generated schema to validate against")
+    parser.add_argument("--interval", type=float, default=0.25, help="seconds between checks for changed files")
+    parser.add_argument("--once", action="store_true", help="validate everything once and exit")
+    args = parser.parse_args()
+
+    validator = WatchValidator(args.schema)
+    seen = {}
+    failed = False
+    while True:
+        current = snapshot(args.paths)
+        for path in sorted(current):
+            if seen.get(path) != current[path]:
+                errors = validator.update(path)
+                failed = failed or bool(errors)
+                if errors or path in seen:
+                    report(path, errors)
+        for path in set(seen) - set(current):
+            validator.forget(path)
+            print("%s: removed" % path, flush=True)
+        seen = current
+        if args.once:
+            return 1 if failed else 0
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,70 @@
+import pytest
+
+from pfx_binary import PfxBinary, effectiveSystem, roundTrips, writeBinary
+
+
+curveForms = [
+    2,
+    -0.5,
+    [],
+    [[0, 1]],
+    [[0, 1.5], [0.5, -2], [1, 3]],
+    {"keys": [[0, 1], [1, 0]]},
+    {"keys": [[0, 1], [1, 0]], "stepped": True},
+    {"keys": [[0, 1]], "stepped": False},
+    {"stepped": True},
+    {"keys": []},
+    {},
+]
+
+burstForms = [
+    0,
+    5,
+    [],
+    [[0, 5]],
+    [[0.5, 5, 2]],
+    [[1, 3, 1, 0.5], [0, 7]],
+    [{"time": 0.25, "count": 4}],
+    [{"time": 0.5, "count": 4, "countRange": 2, "chance": 0.25}, {"count": 1}],
+]
+
+
+def systems():
+    yield {}
+    yield {"emitters": []}
+    yield {"emitters": [{}], "color": [1, 0.5, 0, 1]}
+    for value in curveForms:
+        yield {"emitters": [{"sizeX": value, "lifetime": value}]}
+        yield {"emitters": [{"emissionRate": value, "emissionBursts": 3}]}
+    for value in burstForms:
+        yield {"emitters": [{"emissionBursts": value}]}
+        yield {"emitters": [{"emissionBursts": value, "emissionRate": 0.0}]}
+        yield {"emitters": [{"emissionBursts": value, "emissionRate": 20.0}]}
+    yield {"emitters": [{
+        "type": "EMITTER", "linkIndex": 1, "loopCount": 3, "bLoop": True, "delay": 0.25,
+        "spec": {"shader": "particle_add", "baseTexture": "/pa/effects/textures/particles/flat.papa"},
+        "rgb": [[0, 1, 0, 0], [1, 0, 0, 1]], "custom": {"kept": [1, 2]},
+    }, 7, "not an emitter"]}
+
+
+@pytest.mark.parametrize("system", list(systems()))
+def test_round_trip(system, tmp_path):
+    assert roundTrips(system, str(tmp_path / "effect.pfxb"))
+
+
+def test_bursts_keep_emission_rate_default(tmp_path):
+    path = str(tmp_path / "effect.pfxb")
+    writeBinary({"emitters": [{"emissionBursts": 0}]}, path)
+    with PfxBinary(path) as pfx:
+        decoded = pfx.toJson()
+    assert decoded == {"emitters": [{"emissionBursts": 0}]}
+    assert effectiveSystem(decoded)["emitters"][0]["emissionRate"] == 0.0
+
+
+def test_views_outlive_close(tmp_path):
+    path = str(tmp_path / "effect.pfxb")
+    writeBinary({"emitters": [{"lifetime": [[0, 1], [1, 2]]}]}, path)
+    with PfxBinary(path) as pfx:
+        emitter = pfx.emitter(0)
+        curve = emitter.curve("lifetime")
+    assert curve.tolist() == [[0, 1], [1, 2]]
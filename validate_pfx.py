@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+import argparse
+import hashlib
+import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pfx_validator
+
+
+here = os.path.dirname(os.path.abspath(__file__))
+cachedHashes = frozenset()
+
+
+def schemaHash():
+    # The cache is only valid for the schema and validator it was built with.
+    digest = hashlib.sha256()
+    for name in ("pfx-schema", "pfx_validator.py"):
+        with open(os.path.join(here, name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def findEffects(roots):
+    for root in roots:
+        if os.path.isfile(root):
+            yield root
+            continue
+        for directory, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if filename.endswith(".pfx"):
+                    yield os.path.join(directory, filename)
+
+
+def parseErrors(data):
+    try:
+        system = json.loads(data.decode("utf-8-sig"))
+    except ValueError as e:
+        return [["", "invalid JSON: %s" % e]]
+    if pfx_validator.isValid(system):
+        return []
+    return [list(error) for error in pfx_validator.iterErrors(system)]
+
+
+def initWorker(hashes):
+    global cachedHashes
+    cachedHashes = hashes
+
+
+def validateFiles(paths):
+    # Each file is read and hashed once, here in the worker. Errors are None
+    # for content the cache already has a result for.
+    results = []
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            results.append((path, None, [["", str(e)]]))
+            continue
+        contentHash = hashlib.sha256(data).hexdigest()
+        results.append((path, contentHash, None if contentHash in cachedHashes else parseErrors(data)))
+    return results
+
+
+def loadCache(path, schema):
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get("schema") != schema:
+        return {}
+    return cache.get("results", {})
+
+
+def saveCache(path, schema, results):
+    temp = path + ".tmp"
+    with open(temp, "w") as f:
+        json.dump({"schema": schema, "results": results}, f)
+    os.replace(temp, path)
+
+
+def report(path, errors, cached, verbose):
+    if errors:
+        for pointer, message in errors:
+            print("%s:%s: %s" % (path, pointer or "/", message), flush=True)
+    elif verbose:
+        print("%s: ok%s" % (path, " (cached)" if cached else ""), flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate .pfx particle system files against the generated schema.")
+    parser.add_argument("paths", nargs="+", help="files or directories to search for .pfx files")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--cache", default=".pfx-validate-cache", help="result cache file, keyed by file content and schema hash")
+    parser.add_argument("--no-cache", action="store_true", help="ignore and do not update the result cache")
+    parser.add_argument("--batch", type=int, default=64, help="most files handed to a worker at a time")
+    parser.add_argument("-v", "--verbose", action="store_true", help="also list files that pass")
+    args = parser.parse_args()
+
+    schema = schemaHash()
+    cached = {} if args.no_cache else loadCache(args.cache, schema)
+    results = {}
+    paths = list(findEffects(args.paths))
+    failed = 0
+    checked = 0
+    fromCache = 0
+
+    if paths:
+        # Small runs are split evenly so that every worker gets a share.
+        jobs = args.jobs or os.cpu_count() or 1
+        size = max(1, min(args.batch, math.ceil(len(paths) / jobs)))
+        with ProcessPoolExecutor(max_workers=jobs, initializer=initWorker, initargs=(frozenset(cached),)) as pool:
+            batches = [paths[i:i + size] for i in range(0, len(paths), size)]
+            for future in as_completed([pool.submit(validateFiles, batch) for batch in batches]):
+                for path, contentHash, errors in future.result():
+                    hit = errors is None
+                    if hit:
+                        errors = cached[contentHash]
+                        fromCache += 1
+                    else:
+                        checked += 1
+                    if contentHash is not None:
+                        results[contentHash] = errors
+                    failed += bool(errors)
+                    report(path, errors, hit, args.verbose)
+
+    if not args.no_cache:
+        # Entries for files outside this run stay, so checking one file
+        # does not throw away the results for the rest of the tree.
+        cached.update(results)
+        saveCache(args.cache, schema, cached)
+
+    print("%d files checked, %d from cache, %d invalid" % (checked, fromCache, failed), file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())